@@ -18,6 +18,7 @@ The world scrolls via a camera offset.
 """
 
 import pygame
+import bisect
 import random
 import sys
 import time
@@ -37,6 +38,13 @@ FPS = 60
 GRAVITY = 0.5
 PLAYER_SPEED = 5
 JUMP_STRENGTH = -10
+# Ghosts whose world x is further than this from the player are skipped by the collision test.
+COLLISION_CULL_DIST = SCREEN_WIDTH // 2
+# Fixed simulation step for Act I, and the most frame time simulated after a stall.
+FIXED_DT = 1.0 / FPS
+MAX_FRAME_TIME = 0.25
+# Player animation states that count as attacking (set membership instead of a prefix test).
+ATTACK_STATES = frozenset(('attack1', 'attack2'))
 
 # Level width for main game scrolling
 LEVEL_WIDTH = 10 * SCREEN_WIDTH
@@ -51,6 +59,7 @@ RED = (255, 0, 0)
 # Font – will be loaded after pygame.font.init()
 PIXEL_FONT_SIZE = 28
 PIXEL_FONT = None
+PIXEL_FONT_HEIGHT = 0  # cached PIXEL_FONT.get_height(), set in main()
 
 # For white text (gradient)
 TAN_TOP = (255, 255, 255)
@@ -59,17 +68,29 @@ TAN_BOTTOM = (255, 255, 255)
 # ---------------------------
 # Helper: Render Gradient Text
 # ---------------------------
+# One-pixel-wide gradient columns keyed by (height, color_start, color_end).
+_gradient_columns = {}
+
+def get_gradient_column(height, color_start, color_end):
+    key = (height, tuple(color_start), tuple(color_end))
+    column = _gradient_columns.get(key)
+    if column is None:
+        column = pygame.Surface((1, height)).convert_alpha()
+        for y in range(height):
+            ratio = y / height
+            r = int(color_start[0]*(1 - ratio) + color_end[0]*ratio)
+            g = int(color_start[1]*(1 - ratio) + color_end[1]*ratio)
+            b = int(color_start[2]*(1 - ratio) + color_end[2]*ratio)
+            column.set_at((0, y), (r, g, b, 255))
+        _gradient_columns[key] = column
+    return column
+
 def render_gradient_text(text, font, color_start, color_end):
     text_surface = font.render(text, True, (255, 255, 255))
     text_surface = text_surface.convert_alpha()
     width, height = text_surface.get_size()
-    gradient = pygame.Surface((width, height)).convert_alpha()
-    for y in range(height):
-        ratio = y / height
-        r = int(color_start[0]*(1 - ratio) + color_end[0]*ratio)
-        g = int(color_start[1]*(1 - ratio) + color_end[1]*ratio)
-        b = int(color_start[2]*(1 - ratio) + color_end[2]*ratio)
-        pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
+    # Stretch the cached column across the text in C instead of drawing one line per row.
+    gradient = pygame.transform.scale(get_gradient_column(height, color_start, color_end), (width, height))
     text_surface.blit(gradient, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
     return text_surface
 
@@ -91,14 +112,12 @@ def load_individual_frames(base_folder, animation, frame_count, variant=""):
         variant_part = f"-{variant}" if variant else ""
         filename = f"adventurer-{animation}{variant_part}-{i:02d}.png"
         full_path = os.path.join(base_folder, filename)
-        if os.path.exists(full_path):
-            try:
-                image = pygame.image.load(full_path).convert_alpha()
-                frames.append(image)
-            except Exception as e:
-                print(f"Error loading {full_path}: {e}")
-        else:
+        try:
+            frames.append(pygame.image.load(full_path).convert_alpha())
+        except FileNotFoundError:
             print(f"Missing file: {full_path}")
+        except Exception as e:
+            print(f"Error loading {full_path}: {e}")
     return frames
 
 # ---------------------------
@@ -106,10 +125,10 @@ def load_individual_frames(base_folder, animation, frame_count, variant=""):
 # ---------------------------
 def show_loadscreen(screen):
     loadscreen_path = "loadscreen.png"
-    if os.path.exists(loadscreen_path):
-        load_img = pygame.image.load(loadscreen_path).convert_alpha()
-    else:
-        load_img = pygame.Surface((768, 768), pygame.SRCALPHA)
+    try:
+        load_img = pygame.image.load(loadscreen_path).convert()
+    except (FileNotFoundError, pygame.error):
+        load_img = pygame.Surface((768, 768))
         load_img.fill(BLACK)
     scale_factor = min(SCREEN_WIDTH / 768, SCREEN_HEIGHT / 768)
     new_width = int(768 * scale_factor)
@@ -136,10 +155,10 @@ def show_loadscreen(screen):
 # ---------------------------
 def show_opening_scene(screen):
     tomb_bg_path = "tomb.png"
-    if os.path.exists(tomb_bg_path):
-        bg = pygame.image.load(tomb_bg_path).convert_alpha()
+    try:
+        bg = pygame.image.load(tomb_bg_path).convert()
         bg = pygame.transform.scale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-    else:
+    except (FileNotFoundError, pygame.error):
         bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         bg.fill(BLACK)
     
@@ -160,50 +179,42 @@ def show_opening_scene(screen):
     word_delay = 300
     last_word_time = pygame.time.get_ticks()
     word_index = 0
+    lines = []
 
+    # Once the last word is shown, keep rendering for 3 seconds, then show the
+    # prompt and wait for X in the same loop (no blocking delay).
+    words_done_time = None
+    prompt_surface = None
     opening_done = False
     while not opening_done:
         dt = clock.tick(FPS)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
+            if prompt_surface is not None and event.type == pygame.KEYDOWN and event.key == pygame.K_x:
+                opening_done = True
         screen.blit(bg, (0, 0))
         current_time = pygame.time.get_ticks()
         if word_index < len(words) and current_time - last_word_time >= word_delay:
             displayed_text += (" " if displayed_text else "") + words[word_index]
             word_index += 1
             last_word_time = current_time
+            lines = textwrap.wrap(displayed_text, width=70)
+        if word_index >= len(words) and words_done_time is None:
+            words_done_time = current_time
+        if prompt_surface is None and words_done_time is not None and current_time - words_done_time >= 3000:
+            prompt = "Press X to start the game"
+            prompt_surface = render_gradient_text(prompt, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
+            prompt_rect = prompt_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
 
-        lines = textwrap.wrap(displayed_text, width=70)
         y_offset = 50
         for line in lines:
             line_surface = render_gradient_text(line, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
             screen.blit(line_surface, (50, y_offset))
-            y_offset += PIXEL_FONT.get_height() + 5
+            y_offset += PIXEL_FONT_HEIGHT + 5
+        if prompt_surface is not None:
+            screen.blit(prompt_surface, prompt_rect)
         pygame.display.flip()
-
-        if word_index >= len(words):
-            pygame.time.delay(3000)
-            prompt = "Press X to start the game"
-            prompt_surface = render_gradient_text(prompt, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-            prompt_rect = prompt_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
-            waiting_for_key = True
-            while waiting_for_key:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit(); sys.exit()
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_x:
-                        waiting_for_key = False
-                screen.blit(bg, (0, 0))
-                lines = textwrap.wrap(displayed_text, width=70)
-                y_offset = 50
-                for line in lines:
-                    line_surface = render_gradient_text(line, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-                    screen.blit(line_surface, (50, y_offset))
-                    y_offset += PIXEL_FONT.get_height() + 5
-                screen.blit(prompt_surface, prompt_rect)
-                pygame.display.flip()
-            opening_done = True
     pygame.mixer.music.stop()
 
 # ---------------------------
@@ -235,12 +246,13 @@ def show_stage_intro(screen):
 # ---------------------------
 def load_background_act1(start=True):
     filename = "Level_1_backgroundstart.png" if start else "Level_1_background.png"
-    if os.path.exists(filename):
-        bg = pygame.image.load(filename).convert_alpha()
+    try:
+        # Backgrounds are fully opaque, so skip the per-pixel alpha blit path.
+        bg = pygame.image.load(filename).convert()
         bg = pygame.transform.scale(bg, (LEVEL_WIDTH, SCREEN_HEIGHT))
         return bg
-    else:
-        bg = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    except (FileNotFoundError, pygame.error):
+        bg = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT)).convert()
         bg.fill((50, 50, 50))
         return bg
 
@@ -249,29 +261,39 @@ def load_background_act1(start=True):
 # ---------------------------
 class GhostEnemy(pygame.sprite.Sprite):
     """Ghost enemy from ghost_sheet.png. Has 3 hit points; each hit advances its decay row."""
-    def __init__(self, x, y, speed):
-        pygame.sprite.Sprite.__init__(self)
+    # Converted and scaled frames shared by every ghost; loaded on the first spawn.
+    shared_frames = None
+
+    @classmethod
+    def load_frames(cls):
         ghost_sheet_path = os.path.join("assets", "ghost_sheet.png")
-        if os.path.exists(ghost_sheet_path):
+        try:
             sheet = pygame.image.load(ghost_sheet_path).convert_alpha()
+        except (FileNotFoundError, pygame.error):
+            fallback = pygame.Surface((48, 48), pygame.SRCALPHA)
+            fallback.fill(RED)
+            frames = [[fallback]*5 for _ in range(3)]
+        else:
             sheet_rect = sheet.get_rect()
             frame_width = sheet_rect.width // 5
             frame_height = sheet_rect.height // 3
-            self.frames = []
+            frames = []
             for row in range(3):
                 row_frames = []
                 for col in range(5):
                     rect = pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
                     frame = sheet.subsurface(rect).copy()
                     row_frames.append(frame)
-                self.frames.append(row_frames)
-        else:
-            fallback = pygame.Surface((48, 48), pygame.SRCALPHA)
-            fallback.fill(RED)
-            self.frames = [[fallback]*5]
-        self.frames = [[pygame.transform.scale(frame, (int(frame.get_width()*SPRITE_SCALE),
-                                                        int(frame.get_height()*SPRITE_SCALE)))
-                         for frame in row] for row in self.frames]
+                frames.append(row_frames)
+        return [[pygame.transform.scale(frame, (int(frame.get_width()*SPRITE_SCALE),
+                                                 int(frame.get_height()*SPRITE_SCALE)))
+                  for frame in row] for row in frames]
+
+    def __init__(self, x, y, speed):
+        pygame.sprite.Sprite.__init__(self)
+        if GhostEnemy.shared_frames is None:
+            GhostEnemy.shared_frames = GhostEnemy.load_frames()
+        self.frames = GhostEnemy.shared_frames
         self.current_row = 0
         self.current_frame = 0
         self.image = self.frames[self.current_row][self.current_frame]
@@ -297,12 +319,14 @@ class GhostEnemy(pygame.sprite.Sprite):
             self.kill()
 
     def take_hit(self):
+        """Apply one hit; returns True if the hit destroyed the ghost."""
         self.health -= 1
         if self.health > 0:
             self.current_row = 3 - self.health  
             self.current_frame = 0
-        else:
-            self.kill()
+            return False
+        self.kill()
+        return True
 
 # ---------------------------
 # Player Class
@@ -372,7 +396,7 @@ class Player(pygame.sprite.Sprite):
 
     def update(self, dt):
         keys = pygame.key.get_pressed()
-        if not self.state.startswith("attack"):
+        if self.state not in ATTACK_STATES:
             if keys[pygame.K_LEFT]:
                 self.vel_x = -PLAYER_SPEED
             elif keys[pygame.K_RIGHT]:
@@ -398,7 +422,7 @@ class Player(pygame.sprite.Sprite):
                 self.jump_pressed = True
         else:
             self.jump_pressed = False
-        if self.state.startswith("attack"):
+        if self.state in ATTACK_STATES:
             new_state = self.state
         else:
             if keys[pygame.K_a]:
@@ -418,7 +442,7 @@ class Player(pygame.sprite.Sprite):
         self.animation_timer += dt
         if self.animation_timer >= self.animation_delay:
             old_midbottom = self.rect.midbottom
-            if self.state.startswith("attack"):
+            if self.state in ATTACK_STATES:
                 if self.current_frame < len(self.frames) - 1:
                     self.current_frame += 1
                 else:
@@ -491,18 +515,22 @@ class Knight(pygame.sprite.Sprite):
         self.attack_cooldown = 0.0
 
     def update(self, dt, player):
-        if abs(self.world_x - player.world_x) < 300:
-            self.state = 'attack'
-        else:
-            self.state = 'walk'
-        self.frames = self.animations[self.state]
+        px = player.world_x
+        new_state = 'attack' if abs(self.world_x - px) < 300 else 'walk'
+        if new_state != self.state:
+            self.state = new_state
+            self.frames = self.animations[new_state]
+            self.current_frame = 0
         self.animation_timer += dt
         if self.animation_timer >= self.animation_delay:
             self.current_frame = (self.current_frame + 1) % len(self.frames)
             self.image = self.frames[self.current_frame]
             self.animation_timer = 0.0
-        self.rect.x = self.world_x
-        self.rect.y = self.world_y
+        # The knight never moves (vel_x is unused), so only sync rect when needed.
+        if self.rect.x != self.world_x:
+            self.rect.x = self.world_x
+        if self.rect.y != self.world_y:
+            self.rect.y = self.world_y
         if self.attack_cooldown > 0:
             self.attack_cooldown -= dt
 
@@ -516,6 +544,11 @@ def battle_with_knight(screen, player, score):
     battle_clock = pygame.time.Clock()
     battle_running = True
     battle_start_time = time.time()
+    hud_positions = ((20, 20), (20, 60), (20, 100), (20, 140))
+    hud_cache = [(None, None, pygame.Rect(pos, (0, 0))) for pos in hud_positions]  # (text, surface, rect)
+    prev_sprite_rects = []
+    screen.fill(BLACK)
+    pygame.display.flip()
     while battle_running:
         dt = battle_clock.tick(FPS) / 1000.0
         for event in pygame.event.get():
@@ -524,7 +557,7 @@ def battle_with_knight(screen, player, score):
         player.update(dt)
         knight.update(dt, player)
         if player.rect.colliderect(knight.rect):
-            if player.state.startswith("attack") and player.bounce_cooldown <= 0:
+            if player.state in ATTACK_STATES and player.bounce_cooldown <= 0:
                 knight.health -= 15
                 player.bounce_cooldown = 0.5
             if knight.state == 'attack' and knight.attack_cooldown <= 0:
@@ -538,23 +571,28 @@ def battle_with_knight(screen, player, score):
             battle_running = False
             result_text = "Defeat! You were slain by the Knight."
         camera_x = (player.world_x + knight.world_x) / 2 - SCREEN_WIDTH / 2
-        screen.fill(BLACK)
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        knight_screen_rect = knight.rect.copy()
-        knight_screen_rect.x = knight.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        screen.blit(knight.image, knight_screen_rect)
-        p_health_surface = render_gradient_text(f"Player HP: {player.health}", PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        k_health_surface = render_gradient_text(f"Knight HP: {knight.health}", PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        score_surface = render_gradient_text(f"Score: {score}", PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        battle_time = int(time.time() - battle_start_time)
-        time_surface = render_gradient_text(f"Battle Time: {battle_time} sec", PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        screen.blit(p_health_surface, (20, 20))
-        screen.blit(k_health_surface, (20, 60))
-        screen.blit(score_surface, (20, 100))
-        screen.blit(time_surface, (20, 140))
-        pygame.display.flip()
+        # Erase last frame's sprites (and any HUD rows about to change) instead of clearing the screen.
+        hud_texts = (f"Player HP: {player.health}", f"Knight HP: {knight.health}", f"Score: {score}",
+                     f"Battle Time: {int(time.time() - battle_start_time)} sec")
+        dirty_rects = prev_sprite_rects
+        for rect in prev_sprite_rects:
+            screen.fill(BLACK, rect)
+        for i, text in enumerate(hud_texts):
+            if text != hud_cache[i][0]:
+                screen.fill(BLACK, hud_cache[i][2])
+                dirty_rects.append(hud_cache[i][2])
+                hud_surface = render_gradient_text(text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
+                hud_cache[i] = (text, hud_surface, hud_surface.get_rect(topleft=hud_positions[i]))
+                dirty_rects.append(hud_cache[i][2])
+        player_screen_rect = screen.blit(player.image, (player.world_x - camera_x, player.rect.y))
+        knight_screen_rect = screen.blit(knight.image, (knight.world_x - camera_x, knight.rect.y))
+        prev_sprite_rects = [player_screen_rect, knight_screen_rect]
+        dirty_rects.extend(prev_sprite_rects)
+        # HUD rows are redrawn on top only when their text changed or a sprite touched them.
+        for text, hud_surface, hud_rect in hud_cache:
+            if hud_rect.collidelist(dirty_rects) != -1:
+                screen.blit(hud_surface, hud_rect)
+        pygame.display.update(dirty_rects)
     end_clock = pygame.time.Clock()
     end_time = time.time()
     while time.time() - end_time < 3:
@@ -577,22 +615,22 @@ class EnemyCrow(pygame.sprite.Sprite):
     def __init__(self, x, y, speed):
         pygame.sprite.Sprite.__init__(self)
         crow_sheet_path = os.path.join("assets", "crow_fly.png")
-        if os.path.exists(crow_sheet_path):
-            try:
-                sheet = pygame.image.load(crow_sheet_path).convert_alpha()
-                sheet_rect = sheet.get_rect()
-                frame_width = sheet_rect.width // 2
-                frame_height = sheet_rect.height
-                self.frames = []
-                for i in range(2):
-                    rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
-                    frame = sheet.subsurface(rect).copy()
-                    self.frames.append(frame)
-            except Exception as e:
-                print("Error loading crow_fly.png:", e)
-                fallback = pygame.Surface((48, 48), pygame.SRCALPHA)
-                fallback.fill(RED)
-                self.frames = [fallback]
+        try:
+            sheet = pygame.image.load(crow_sheet_path).convert_alpha()
+        except FileNotFoundError:
+            sheet = None
+        except pygame.error as e:
+            print("Error loading crow_fly.png:", e)
+            sheet = None
+        if sheet is not None:
+            sheet_rect = sheet.get_rect()
+            frame_width = sheet_rect.width // 2
+            frame_height = sheet_rect.height
+            self.frames = []
+            for i in range(2):
+                rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
+                frame = sheet.subsurface(rect).copy()
+                self.frames.append(frame)
         else:
             fallback = pygame.Surface((48, 48), pygame.SRCALPHA)
             fallback.fill(RED)
@@ -650,20 +688,54 @@ class ActILevel:
         self.bg_start = load_background_act1(start=True)
         self.bg_main = load_background_act1(start=False)
         self.current_bg = self.bg_start
+        # Ghost spawns follow a precomputed schedule instead of a per-frame dice roll.
+        # Gaps are exponentially distributed, matching the old 1% * difficulty chance per frame.
+        self.spawn_min_y = SCREEN_HEIGHT - 300
+        self.spawn_max_y = SCREEN_HEIGHT - 80
+        self.frame_count = 0
+        self.next_spawn_frame = self.next_spawn_gap()
+        # Parallel lists of live ghosts, their rects and world x positions, refreshed each
+        # update, so the player collision test can run as one C-level Rect.collidelistall
+        # call and the draw pass reads positions without per-ghost attribute lookups.
+        self.enemies = []
+        self.enemy_rects = []
+        self.enemy_world_x = []
+        # Reused (image, dest) list for batching the ghost blits each frame.
+        self.blit_seq = []
+
+    def next_spawn_gap(self):
+        return int(random.expovariate(0.01 * self.adaptive_engine.difficulty))
 
     def update(self, dt):
-        self.enemy_list.update(dt)
-        if random.random() < 0.01 * self.adaptive_engine.difficulty:
-            enemy_y = random.randint(SCREEN_HEIGHT - 300, SCREEN_HEIGHT - 80)
+        # Step the ghosts straight from the cached list instead of Group.update(),
+        # which copies the group's sprite dict and re-dispatches on every call.
+        # Drop ghosts once they are a full screen behind the player, well out of view,
+        # rather than waiting for them to drift past world x 0.
+        despawn_x = player.world_x - SCREEN_WIDTH
+        for enemy in self.enemies:
+            enemy.update(dt)
+            if enemy.world_x < despawn_x:
+                enemy.kill()
+        self.frame_count += 1
+        if self.frame_count >= self.next_spawn_frame:
+            enemy_y = random.randint(self.spawn_min_y, self.spawn_max_y)
             enemy = GhostEnemy(player.world_x + SCREEN_WIDTH, enemy_y, self.adaptive_engine.enemy_speed)
             self.enemy_list.add(enemy)
+            self.next_spawn_frame = self.frame_count + self.next_spawn_gap()
+        self.refresh_enemy_lists()
+
+    def refresh_enemy_lists(self):
+        # Sorted by world x so callers can bisect enemy_world_x for a window of nearby ghosts.
+        self.enemies = sorted(self.enemy_list, key=lambda enemy: enemy.world_x)
+        self.enemy_rects = [enemy.rect for enemy in self.enemies]
+        self.enemy_world_x = [enemy.world_x for enemy in self.enemies]
 
 # ---------------------------
 # Main Game Loop (Act I)
 # ---------------------------
 def main():
     global quote_index, current_quote, current_quote_kill_count, current_quote_display, quote_reset_time
-    global mentor, mentor_spawned, mentor_spoken, chest, chest_spawned, letter_shown, player, score, PIXEL_FONT
+    global mentor, mentor_spawned, mentor_spoken, chest, chest_spawned, letter_shown, player, score, PIXEL_FONT, PIXEL_FONT_HEIGHT
 
     pygame.init()
     pygame.font.init()
@@ -672,6 +744,7 @@ def main():
     except Exception as e:
         print("Error initializing mixer:", e)
     PIXEL_FONT = pygame.font.Font("Pixel_NES.ttf", PIXEL_FONT_SIZE)
+    PIXEL_FONT_HEIGHT = PIXEL_FONT.get_height()
     
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Hamlet's Descent - Act I")
@@ -699,52 +772,97 @@ def main():
         player.jump_sound = pygame.mixer.Sound("jump.mp3")
     else:
         player.jump_sound = None
+    sword_sound = pygame.mixer.Sound("sword.mp3") if os.path.exists("sword.mp3") else None
 
     score = 0
     level_start_x = player.world_x
     fixed_player_screen_x = 100
     # Background transition: after 4 screen-widths from level_start_x, switch backgrounds
     stage_transition_x = level_start_x + 4 * SCREEN_WIDTH
+    # HUD surface is only re-rendered when score or health changes.
+    hud_template = "Score: %d   Health: %d"
+    hud_key = None
+    hud_surface = None
+    # Dirty-rect state: screen rects drawn last frame, and the camera/background they were drawn with.
+    prev_rects = []
+    last_camera_x = None
+    last_bg = None
+    accumulator = 0.0
+    # Act I only reacts to QUIT (movement reads key.get_pressed()), so keep mouse,
+    # window and other events from ever being queued and turned into Python objects.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
 
     while True:
         dt = clock.tick(FPS) / 1000.0
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
-        player.update(dt)
-        act1_level.update(dt)
-        if player.world_x >= stage_transition_x:
-            act1_level.current_bg = act1_level.bg_main
+        # Step the simulation in fixed ticks (zero or more per frame); render every frame.
+        accumulator = min(accumulator + dt, MAX_FRAME_TIME)
+        while accumulator >= FIXED_DT:
+            accumulator -= FIXED_DT
+            player.update(FIXED_DT)
+            act1_level.update(FIXED_DT)
+            if player.world_x >= stage_transition_x:
+                act1_level.current_bg = act1_level.bg_main
+
+            # Handle collisions with ghost enemies:
+            enemies = act1_level.enemies
+            enemy_world_x = act1_level.enemy_world_x
+            lo = bisect.bisect_left(enemy_world_x, player.world_x - COLLISION_CULL_DIST)
+            hi = bisect.bisect_right(enemy_world_x, player.world_x + COLLISION_CULL_DIST)
+            enemy_hits = [enemies[lo + i] for i in player.rect.collidelistall(act1_level.enemy_rects[lo:hi])]
+            if enemy_hits:
+                # Any ghost contact bounces the player; only attacks damage the ghosts.
+                player.vel_y = JUMP_STRENGTH
+                if player.state in ATTACK_STATES:
+                    score += 2 * sum(map(GhostEnemy.take_hit, enemy_hits))
+                    act1_level.refresh_enemy_lists()
+                    if sword_sound:
+                        sword_sound.play()
 
         camera_x = player.world_x - fixed_player_screen_x
 
-        # Handle collisions with ghost enemies:
-        enemy_hits = pygame.sprite.spritecollide(player, act1_level.enemy_list, False)
-        if enemy_hits:
-            if player.state.startswith("attack"):
-                for enemy in enemy_hits:
-                    enemy.take_hit()
-                    if enemy.health <= 0:
-                        score += 2
-                if os.path.exists("sword.mp3"):
-                    pygame.mixer.Sound("sword.mp3").play()
-                player.vel_y = JUMP_STRENGTH
-            else:
-                player.vel_y = JUMP_STRENGTH
-
-        screen.fill(BLACK)
-        screen.blit(act1_level.current_bg, (-camera_x, 0))
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        for enemy in act1_level.enemy_list:
-            enemy_screen_rect = enemy.rect.copy()
-            enemy_screen_rect.x = enemy.world_x - camera_x
-            screen.blit(enemy.image, enemy_screen_rect)
-        hud_text = f"Score: {score}   Health: {player.health}"
-        hud_surface = render_gradient_text(hud_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        screen.blit(hud_surface, (20, 20))
-        pygame.display.flip()
+        bg = act1_level.current_bg
+        if camera_x != last_camera_x or bg is not last_bg:
+            # The camera scrolled (or the background changed), so the whole frame is new.
+            # Copy only the visible strip of the level-wide background.
+            view_rect = pygame.Rect(camera_x, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+            if not bg.get_rect().contains(view_rect):
+                screen.fill(BLACK)
+            screen.blit(bg, (0, 0), view_rect)
+            dirty_rects = None
+            last_camera_x = camera_x
+            last_bg = bg
+        else:
+            # Static camera: erase last frame's sprites and HUD by restoring the background under them.
+            for rect in prev_rects:
+                screen.fill(BLACK, rect)
+                screen.blit(bg, rect, rect.move(camera_x, 0))
+            dirty_rects = prev_rects
+        # The camera tracks the player, so the player's screen x is always fixed_player_screen_x.
+        player_rect = screen.blit(player.image, (fixed_player_screen_x, player.rect.y))
+        blit_seq = act1_level.blit_seq
+        blit_seq.clear()
+        # Ghosts are sorted by world x: stop at the first one past the right edge of the view,
+        # and skip any that have already scrolled off the left edge.
+        view_end = bisect.bisect_left(act1_level.enemy_world_x, camera_x + SCREEN_WIDTH)
+        blit_seq.extend((enemy.image, (world_x - camera_x, rect.y))
+                        for enemy, rect, world_x in zip(act1_level.enemies[:view_end], act1_level.enemy_rects, act1_level.enemy_world_x)
+                        if world_x + rect.width > camera_x)
+        new_rects = screen.blits(blit_seq)
+        if hud_key != (score, player.health):
+            hud_key = (score, player.health)
+            hud_text = hud_template % hud_key
+            hud_surface = render_gradient_text(hud_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
+        new_rects.append(player_rect)
+        new_rects.append(screen.blit(hud_surface, (20, 20)))
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects + new_rects)
+        prev_rects = new_rects
 
 if __name__ == '__main__':
     main()
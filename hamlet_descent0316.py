@@ -19,6 +19,7 @@ The game uses a horizontal camera offset.
 """
 
 import pygame
+import functools
 import random
 import sys
 import time
@@ -38,6 +39,13 @@ FPS = 60
 GRAVITY = 0.5
 PLAYER_SPEED = 5
 JUMP_STRENGTH = -10
+# Enemies further than this to the right of the camera move but do not animate
+ANIMATION_RANGE_X = int(1.5 * SCREEN_WIDTH)
+# Enemies spawn with their y in [ENEMY_SPAWN_Y_MIN, ENEMY_SPAWN_Y_MAX]
+ENEMY_SPAWN_Y_MIN = SCREEN_HEIGHT - 300
+ENEMY_SPAWN_Y_MAX = SCREEN_HEIGHT - 80
+# Spawn y picker with the range bound once, instead of random.randint re-checking it per spawn
+random_spawn_y = functools.partial(random.randrange, ENEMY_SPAWN_Y_MIN, ENEMY_SPAWN_Y_MAX + 1)
 
 # Level width for scrolling in Act I (and beyond)
 LEVEL_WIDTH = 10 * SCREEN_WIDTH
@@ -53,6 +61,13 @@ RED = (255, 0, 0)
 PLAYER_SCALE = SPRITE_SCALE * 1.8      # Make player slightly larger
 GHOST_SCALE = SPRITE_SCALE * 0.3       # Ghost enemy appears smaller
 
+# Player animation states; each is an index into Player.animations
+PLAYER_IDLE, PLAYER_RUN, PLAYER_JUMP, PLAYER_ATTACK1, PLAYER_ATTACK2 = range(5)
+PLAYER_ANIMATIONS = ("idle", "run", "jump", "attack1", "attack2")
+# Next non-attacking player state, indexed by (on_ground << 2) | (moving << 1) | attack_key
+PLAYER_STATE_TABLE = (PLAYER_JUMP, PLAYER_ATTACK1, PLAYER_JUMP, PLAYER_ATTACK1,
+                      PLAYER_IDLE, PLAYER_ATTACK1, PLAYER_RUN, PLAYER_ATTACK1)
+
 # Font – will be loaded after pygame.font.init()
 PIXEL_FONT_SIZE = 28
 PIXEL_FONT = None
@@ -61,20 +76,38 @@ PIXEL_FONT = None
 TAN_TOP = (255, 255, 255)
 TAN_BOTTOM = (255, 255, 255)
 
+# Timer event that reveals the next word of the opening letter
+WORD_REVEAL_EVENT = pygame.USEREVENT + 1
+
 # ---------------------------
 # Helper: Render Gradient Text
 # ---------------------------
-def render_gradient_text(text, font, color_start, color_end):
-    text_surface = font.render(text, True, (255, 255, 255))
-    text_surface = text_surface.convert_alpha()
-    width, height = text_surface.get_size()
-    gradient = pygame.Surface((width, height)).convert_alpha()
+# The gradient only varies by row, so it is built once per (height, colours) as a
+# one-pixel-wide column; every string rendered at that height reuses it.
+@functools.lru_cache(maxsize=None)
+def gradient_column(height, color_start, color_end):
+    column = pygame.Surface((1, height)).convert_alpha()
     for y in range(height):
         ratio = y / height
         r = int(color_start[0]*(1 - ratio) + color_end[0]*ratio)
         g = int(color_start[1]*(1 - ratio) + color_end[1]*ratio)
         b = int(color_start[2]*(1 - ratio) + color_end[2]*ratio)
-        pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
+        column.fill((r, g, b), (0, y, 1, 1))
+    return column
+
+# Cached: the opening scene and HUD loops redraw the same strings every frame.
+# Returned surfaces are shared, so callers must blit them rather than draw on them.
+@functools.lru_cache(maxsize=512)
+def render_gradient_text(text, font, color_start, color_end):
+    if color_start == color_end:
+        # A flat "gradient" (e.g. the white TAN_TOP/TAN_BOTTOM pair) is just coloured text:
+        # skip the gradient surface and the multiply pass.
+        return font.render(text, True, color_start).convert_alpha()
+    text_surface = font.render(text, True, (255, 255, 255))
+    text_surface = text_surface.convert_alpha()
+    width, height = text_surface.get_size()
+    # Stretch the cached column across the text with a single C-level scale.
+    gradient = pygame.transform.scale(gradient_column(height, color_start, color_end), (width, height))
     text_surface.blit(gradient, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
     return text_surface
 
@@ -106,36 +139,16 @@ def load_individual_frames(base_folder, animation, frame_count, variant=""):
             print(f"Missing file: {full_path}")
     return frames
 
-# ---------------------------
-# Load Background (Act I)
-# ---------------------------
-def load_background_act1(start=True):
-    filename = "Level_1_backgroundstart.png" if start else "Level_1_background.png"
-    if os.path.exists(filename):
-        bg = pygame.image.load(filename).convert_alpha()
-        # Scale preserving aspect ratio: scale height to SCREEN_HEIGHT
-        scale_factor = SCREEN_HEIGHT / bg.get_height()
-        new_width = int(bg.get_width() * scale_factor)
-        scaled_bg = pygame.transform.scale(bg, (new_width, SCREEN_HEIGHT))
-        # Tile horizontally over LEVEL_WIDTH
-        level_bg = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for x in range(0, LEVEL_WIDTH, new_width):
-            level_bg.blit(scaled_bg, (x, 0))
-        return level_bg
-    else:
-        bg = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        bg.fill((50, 50, 50))
-        return bg
-
 # ---------------------------
 # Show Loadscreen
 # ---------------------------
 def show_loadscreen(screen):
     loadscreen_path = "loadscreen.png"
     if os.path.exists(loadscreen_path):
-        load_img = pygame.image.load(loadscreen_path).convert_alpha()
+        # Full-screen, opaque images: convert() keeps their blits off the per-pixel alpha path.
+        load_img = pygame.image.load(loadscreen_path).convert()
     else:
-        load_img = pygame.Surface((768, 768), pygame.SRCALPHA)
+        load_img = pygame.Surface((768, 768))
         load_img.fill(BLACK)
     scale_factor = min(SCREEN_WIDTH / 768, SCREEN_HEIGHT / 768)
     new_width = int(768 * scale_factor)
@@ -163,7 +176,7 @@ def show_loadscreen(screen):
 def show_opening_scene(screen):
     tomb_bg_path = "tomb.png"
     if os.path.exists(tomb_bg_path):
-        bg = pygame.image.load(tomb_bg_path).convert_alpha()
+        bg = pygame.image.load(tomb_bg_path).convert()
         bg = pygame.transform.scale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
     else:
         bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -182,60 +195,61 @@ def show_opening_scene(screen):
     words = full_text.split()
     displayed_text = ""
     
-    clock = pygame.time.Clock()
     word_delay = 300
-    last_word_time = pygame.time.get_ticks()
     word_index = 0
 
-    opening_done = False
-    while not opening_done:
-        dt = clock.tick(FPS)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-        screen.blit(bg, (0, 0))
-        current_time = pygame.time.get_ticks()
-        if word_index < len(words) and current_time - last_word_time >= word_delay:
-            displayed_text += (" " if displayed_text else "") + words[word_index]
-            word_index += 1
-            last_word_time = current_time
+    # The scene only changes when a word is revealed, so draw the background once and
+    # afterwards repaint and present just the text lines.
+    screen.blit(bg, (0, 0))
+    pygame.display.flip()
+    line_height = PIXEL_FONT.get_height() + 5
+
+    # A repeating timer event reveals each word; between words the loop sleeps in
+    # event.wait() instead of spinning at FPS.
+    pygame.time.set_timer(WORD_REVEAL_EVENT, word_delay)
+    while word_index < len(words):
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            pygame.quit(); sys.exit()
+        if event.type != WORD_REVEAL_EVENT:
+            continue
+        displayed_text += (" " if displayed_text else "") + words[word_index]
+        word_index += 1
 
         lines = textwrap.wrap(displayed_text, width=70)
+        dirty_rects = []
         y_offset = 50
         for line in lines:
             line_surface = render_gradient_text(line, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-            screen.blit(line_surface, (50, y_offset))
-            y_offset += PIXEL_FONT.get_height() + 5
-        pygame.display.flip()
-
-        if word_index >= len(words):
-            pygame.time.delay(3000)
-            prompt = "Press X to start the game"
-            prompt_surface = render_gradient_text(prompt, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-            prompt_rect = prompt_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
-            waiting_for_key = True
-            while waiting_for_key:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit(); sys.exit()
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_x:
-                        waiting_for_key = False
-                screen.blit(bg, (0, 0))
-                lines = textwrap.wrap(displayed_text, width=70)
-                y_offset = 50
-                for line in lines:
-                    line_surface = render_gradient_text(line, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-                    screen.blit(line_surface, (50, y_offset))
-                    y_offset += PIXEL_FONT.get_height() + 5
-                screen.blit(prompt_surface, prompt_rect)
-                pygame.display.flip()
-            opening_done = True
+            line_rect = line_surface.get_rect(topleft=(50, y_offset))
+            screen.blit(bg, line_rect, line_rect)
+            screen.blit(line_surface, line_rect)
+            dirty_rects.append(line_rect)
+            y_offset += line_height
+        pygame.display.update(dirty_rects)
+    pygame.time.set_timer(WORD_REVEAL_EVENT, 0)
+
+    pygame.time.delay(3000)
+    prompt = "Press X to start the game"
+    prompt_surface = render_gradient_text(prompt, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
+    prompt_rect = prompt_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
+    screen.blit(prompt_surface, prompt_rect)
+    pygame.display.update(prompt_rect)
+    waiting_for_key = True
+    while waiting_for_key:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            pygame.quit(); sys.exit()
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_x:
+            waiting_for_key = False
     pygame.mixer.music.stop()
 
 # ---------------------------
 # Show Stage Intro for Act I
 # ---------------------------
-def show_stage_intro(screen):
+# The intro card is static, so the box and its text are composed into one surface once.
+@functools.lru_cache(maxsize=None)
+def build_stage_intro():
     intro_text = ("Stage 1: Fight Your Fears. Given the charge by your father, it is time to let loose your fears and face your demons. "
                   "One awaits you. A onetime friend now turned ghoul. He's everything you should have been. Ladies and gentlemen, here's Fortinbras!")
     text_surface = render_gradient_text(intro_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
@@ -244,9 +258,13 @@ def show_stage_intro(screen):
     box_rect.inflate_ip(padding, padding)
     box = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
     box.fill((0, 0, 0, 200))
+    box.blit(text_surface, text_surface.get_rect(center=(box_rect.width//2, box_rect.height//2)))
+    return box, box_rect
+
+def show_stage_intro(screen):
+    box, box_rect = build_stage_intro()
     screen.fill(BLACK)
     screen.blit(box, box_rect)
-    screen.blit(text_surface, text_surface.get_rect(center=box_rect.center))
     pygame.display.flip()
     waiting = True
     while waiting:
@@ -262,21 +280,82 @@ def show_stage_intro(screen):
 def load_background_act1(start=True):
     filename = "Level_1_backgroundstart.png" if start else "Level_1_background.png"
     if os.path.exists(filename):
-        bg = pygame.image.load(filename).convert_alpha()
+        bg = pygame.image.load(filename).convert()
         # Scale so height equals SCREEN_HEIGHT (preserving aspect ratio)
         scale_factor = SCREEN_HEIGHT / bg.get_height()
         new_width = int(bg.get_width() * scale_factor)
-        scaled_bg = pygame.transform.scale(bg, (new_width, SCREEN_HEIGHT))
-        # Tile horizontally over LEVEL_WIDTH
-        level_bg = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for x in range(0, LEVEL_WIDTH, new_width):
-            level_bg.blit(scaled_bg, (x, 0))
-        return level_bg
+        # Return the single tile; tile_blits repeats it across the level at draw time
+        # instead of keeping a LEVEL_WIDTH-wide copy in memory.
+        return pygame.transform.scale(bg, (new_width, SCREEN_HEIGHT))
     else:
-        bg = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         bg.fill((50, 50, 50))
         return bg
 
+def tile_blits(tile, scroll_x):
+    """(surface, dest) pairs for the copies of tile that overlap the view, within [0, LEVEL_WIDTH)."""
+    tile_width = tile.get_width()
+    first_x = max(scroll_x - scroll_x % tile_width, 0)
+    last_x = min(scroll_x + SCREEN_WIDTH, LEVEL_WIDTH)
+    return [(tile, (x - scroll_x, 0)) for x in range(first_x, last_x, tile_width)]
+
+def build_tile_strip(tile):
+    """Opaque strip of repeated tiles wide enough to cover the view at any offset within one tile."""
+    tile_width = tile.get_width()
+    strip = pygame.Surface((tile_width * (SCREEN_WIDTH // tile_width + 2), SCREEN_HEIGHT)).convert()
+    strip.blits([(tile, (x, 0)) for x in range(0, strip.get_width(), tile_width)], doreturn=False)
+    return strip
+
+def strip_blits(strip, tile, scroll_x):
+    """Like tile_blits, but a view fully inside the level is drawn with a single blit of strip."""
+    if 0 <= scroll_x <= LEVEL_WIDTH - SCREEN_WIDTH:
+        return [(strip, (-(scroll_x % tile.get_width()), 0))]
+    # Near the level edges the tiles have to stop, so fall back to per-tile blits.
+    return tile_blits(tile, scroll_x)
+
+# ---------------------------
+# Parallax Layers (Level 2)
+# ---------------------------
+def load_parallax_layers():
+    """
+    Loads two parallax layers from background files.
+    Returns (tile, factor) pairs; each tile is scaled to SCREEN_HEIGHT and repeated by tile_blits.
+    """
+    layers = []
+    filenames = ["bg_layer1.png", "bg_layer2.png"]
+    factors = [0.3, 0.7]
+    for i, file in enumerate(filenames):
+        try:
+            img = pygame.image.load(file).convert_alpha()
+        except (FileNotFoundError, pygame.error):
+            # Fallback color
+            tile = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+            tile.fill((100 + i*50, 100, 100, 150))
+        else:
+            # Scale so height equals SCREEN_HEIGHT
+            scale_factor = SCREEN_HEIGHT / img.get_height()
+            new_width = int(img.get_width() * scale_factor)
+            tile = pygame.transform.scale(img, (new_width, SCREEN_HEIGHT))
+        layers.append((tile, factors[i]))
+    return layers
+
+def parallax_blits(layers, camera_x):
+    # Every layer's visible tiles in back-to-front order, ready for one Surface.blits call.
+    draws = []
+    for tile, factor in layers:
+        draws.extend(tile_blits(tile, int(camera_x * factor)))
+    return draws
+
+def despawn_offscreen(group):
+    """Remove every sprite whose screen-space rect has scrolled past the left edge, in one call."""
+    group.remove([sprite for sprite in group if sprite.rect.right < 0])
+
+def sprite_blits(sprites):
+    """(image, rect) pairs for sprites whose screen-space rect starts left of the view's right edge."""
+    # update() already moved each rect to screen space and despawn_offscreen removed sprites past
+    # the left edge, so the cull is a single comparison on the offset it computed.
+    return [(sprite.image, sprite.rect) for sprite in sprites if sprite.rect.x < SCREEN_WIDTH]
+
 # ---------------------------
 # Ghost Enemy Class (Act I)
 # ---------------------------
@@ -286,16 +365,28 @@ class GhostEnemy(pygame.sprite.Sprite):
     Has 3 hit points; each hit advances its decay row.
     Each frame is 204x341 in a 3-row, 5-column sheet.
     """
-    def __init__(self, x, y, speed):
-        super().__init__()
+    # Scaled frames shared by every instance; loaded on the first spawn.
+    shared_frames = None
+    # Camera position and clock ticks for the current frame, set by the level loop before updating enemies.
+    camera_x = 0
+    ticks = 0
+
+    @classmethod
+    def load_frames(cls):
         ghost_sheet_path = os.path.join("assets", "ghost_sheet.png")
-        if os.path.exists(ghost_sheet_path):
+        try:
             # Load with alpha
             sheet = pygame.image.load(ghost_sheet_path).convert_alpha()
+        except (FileNotFoundError, pygame.error):
+            # Fallback if sheet not found
+            fallback = pygame.Surface((50, 50), pygame.SRCALPHA).convert_alpha()
+            fallback.fill((255, 0, 0))
+            frames = [[fallback] * 5 for _ in range(3)]
+        else:
             # The sheet is 3 rows x 5 columns, each frame 204x341
             frame_width = 204
             frame_height = 341
-            self.frames = []
+            frames = []
             for row in range(3):
                 row_frames = []
                 for col in range(5):
@@ -305,12 +396,13 @@ class GhostEnemy(pygame.sprite.Sprite):
                         frame_width,
                         frame_height
                     )
-                    frame = sheet.subsurface(rect).copy()
-                    
+                    # transform.scale below returns a new surface, so the subsurface view needs no copy.
+                    frame = sheet.subsurface(rect)
+                
                     # If you have alpha transparency, you don't need set_colorkey.
                     # If you still see a white box, uncomment:
                     # frame.set_colorkey((255, 255, 255))
-                    
+                
                     # Scale the frame
                     scaled_frame = pygame.transform.scale(
                         frame,
@@ -320,12 +412,14 @@ class GhostEnemy(pygame.sprite.Sprite):
                         )
                     )
                     row_frames.append(scaled_frame)
-                self.frames.append(row_frames)
-        else:
-            # Fallback if sheet not found
-            fallback = pygame.Surface((50, 50), pygame.SRCALPHA)
-            fallback.fill((255, 0, 0))
-            self.frames = [[fallback] * 5]
+                frames.append(row_frames)
+        return tuple(tuple(row) for row in frames)
+
+    def __init__(self, x, y, speed):
+        super().__init__()
+        if GhostEnemy.shared_frames is None:
+            GhostEnemy.shared_frames = GhostEnemy.load_frames()
+        self.frames = GhostEnemy.shared_frames
 
         # Start at undamaged row (0), first frame
         self.current_row = 0
@@ -333,32 +427,30 @@ class GhostEnemy(pygame.sprite.Sprite):
         self.image = self.frames[self.current_row][self.current_frame]
         self.rect = self.image.get_rect()
 
-        # Place ghost so its bottom aligns at y
+        # Place ghost so its bottom aligns at y; rect holds the on-screen position
         self.world_x = x
         self.world_y = y - self.rect.height
-        self.rect.x = self.world_x
+        self.rect.x = self.world_x - GhostEnemy.camera_x
         self.rect.y = self.world_y
 
         self.speed = speed
         self.health = 3
-        self.animation_timer = 0.0
-        self.animation_delay = 0.2
+        # Animation frames are derived from the clock; this keeps each ghost's phase distinct.
+        self.animation_start = GhostEnemy.ticks
 
     def update(self, dt):
-        # Move ghost to the left
+        # Move ghost to the left and keep rect in screen space for drawing
         self.world_x -= self.speed
-        self.rect.x = self.world_x
+        rect = self.rect
+        rect.x = self.world_x - GhostEnemy.camera_x
 
-        # Animate
-        self.animation_timer += dt
-        if self.animation_timer >= self.animation_delay:
-            self.current_frame = (self.current_frame + 1) % 5
-            self.image = self.frames[self.current_row][self.current_frame]
-            self.animation_timer = 0.0
+        # Only animate ghosts near the view; ones past the left edge are removed by despawn_offscreen
+        if rect.x > ANIMATION_RANGE_X or rect.right < 0:
+            return
 
-        # Kill if offscreen
-        if self.rect.right < 0:
-            self.kill()
+        # Animate
+        self.current_frame = (GhostEnemy.ticks - self.animation_start) // 200 % 5
+        self.image = self.frames[self.current_row][self.current_frame]
 
     def take_hit(self):
         self.health -= 1
@@ -379,46 +471,25 @@ class Player(pygame.sprite.Sprite):
         self.world_x = x
         self.world_y = y
         self.health = 100
-        self.animations = {}
         base_path = os.path.join("assets", "adventurer")
         frame_width = 71
         frame_height = 86
-        self.animations['idle'] = load_individual_frames(base_path, "idle", 3)
-        if not self.animations['idle']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['idle'] = [fallback]
-        self.animations['run'] = load_individual_frames(base_path, "run", 3)
-        if not self.animations['run']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['run'] = [fallback]
-        self.animations['jump'] = load_individual_frames(base_path, "jump", 3)
-        if not self.animations['jump']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['jump'] = [fallback]
-        self.animations['attack1'] = load_individual_frames(base_path, "attack1", 3)
-        if not self.animations['attack1']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['attack1'] = [fallback]
-        self.animations['attack2'] = load_individual_frames(base_path, "attack2", 3)
-        if not self.animations['attack2']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['attack2'] = [fallback]
-        # Use PLAYER_SCALE for player sprites
-        for key in self.animations:
-            self.animations[key] = [pygame.transform.scale(frame, (int(frame.get_width()*PLAYER_SCALE),
-                                                                    int(frame.get_height()*PLAYER_SCALE)))
-                                    for frame in self.animations[key]]
-        self.state = 'idle'
+        # Frame tuples indexed by PLAYER_* state, with each frame's size precomputed
+        # so animation ticks can resize self.rect without building a new Rect.
+        self.animations = []
+        for animation in PLAYER_ANIMATIONS:
+            frames = load_individual_frames(base_path, animation, 3)
+            if not frames:
+                fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA).convert_alpha()
+                fallback.fill(BLUE)
+                pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
+                frames = [fallback]
+            # Use PLAYER_SCALE for player sprites
+            self.animations.append(tuple(pygame.transform.scale(frame, (int(frame.get_width()*PLAYER_SCALE),
+                                                                         int(frame.get_height()*PLAYER_SCALE)))
+                                         for frame in frames))
+        self.frame_sizes = [tuple(frame.get_size() for frame in frames) for frames in self.animations]
+        self.state = PLAYER_IDLE
         self.frames = self.animations[self.state]
         self.current_frame = 0
         self.image = self.frames[self.current_frame]
@@ -438,7 +509,7 @@ class Player(pygame.sprite.Sprite):
 
     def update(self, dt):
         keys = pygame.key.get_pressed()
-        if not self.state.startswith("attack"):
+        if self.state < PLAYER_ATTACK1:
             if keys[pygame.K_LEFT]:
                 self.vel_x = -PLAYER_SPEED
             elif keys[pygame.K_RIGHT]:
@@ -464,17 +535,10 @@ class Player(pygame.sprite.Sprite):
                 self.jump_pressed = True
         else:
             self.jump_pressed = False
-        if self.state.startswith("attack"):
+        if self.state >= PLAYER_ATTACK1:
             new_state = self.state
         else:
-            if keys[pygame.K_a]:
-                new_state = 'attack1'
-            elif not self.on_ground:
-                new_state = 'jump'
-            elif self.vel_x != 0:
-                new_state = 'run'
-            else:
-                new_state = 'idle'
+            new_state = PLAYER_STATE_TABLE[(self.on_ground << 2) | ((self.vel_x != 0) << 1) | keys[pygame.K_a]]
         if new_state != self.state:
             self.state = new_state
             self.frames = self.animations[self.state]
@@ -484,18 +548,18 @@ class Player(pygame.sprite.Sprite):
         self.animation_timer += dt
         if self.animation_timer >= self.animation_delay:
             old_midbottom = self.rect.midbottom
-            if self.state.startswith("attack"):
+            if self.state >= PLAYER_ATTACK1:
                 if self.current_frame < len(self.frames) - 1:
                     self.current_frame += 1
                 else:
-                    self.state = 'idle'
-                    self.frames = self.animations['idle']
+                    self.state = PLAYER_IDLE
+                    self.frames = self.animations[PLAYER_IDLE]
                     self.current_frame = 0
                 self.image = self.frames[self.current_frame]
             else:
                 self.current_frame = (self.current_frame + 1) % len(self.frames)
                 self.image = self.frames[self.current_frame]
-            self.rect = self.image.get_rect()
+            self.rect.size = self.frame_sizes[self.state][self.current_frame]
             self.rect.midbottom = old_midbottom
             self.animation_timer = 0.0
         if self.bounce_cooldown > 0:
@@ -531,11 +595,11 @@ class Knight(pygame.sprite.Sprite):
         except Exception as e:
             self.animations['attack'] = []
         if not self.animations['walk']:
-            fallback = pygame.Surface((80, 100), pygame.SRCALPHA)
+            fallback = pygame.Surface((80, 100), pygame.SRCALPHA).convert_alpha()
             fallback.fill(RED)
             self.animations['walk'] = [fallback]
         if not self.animations['attack']:
-            fallback = pygame.Surface((80, 100), pygame.SRCALPHA)
+            fallback = pygame.Surface((80, 100), pygame.SRCALPHA).convert_alpha()
             fallback.fill(RED)
             self.animations['attack'] = [fallback]
         for key in self.animations:
@@ -552,8 +616,7 @@ class Knight(pygame.sprite.Sprite):
         self.rect.x = self.world_x
         self.rect.y = self.world_y
         self.vel_x = 0
-        self.animation_timer = 0.0
-        self.animation_delay = 0.3
+        self.animation_start = pygame.time.get_ticks()
         self.attack_cooldown = 0.0
 
     def update(self, dt, player):
@@ -562,121 +625,76 @@ class Knight(pygame.sprite.Sprite):
         else:
             self.state = 'walk'
         self.frames = self.animations[self.state]
-        self.animation_timer += dt
-        if self.animation_timer >= self.animation_delay:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.image = self.frames[self.current_frame]
-            self.animation_timer = 0.0
+        self.current_frame = (pygame.time.get_ticks() - self.animation_start) // 300 % len(self.frames)
+        self.image = self.frames[self.current_frame]
         self.rect.x = self.world_x
         self.rect.y = self.world_y
         if self.attack_cooldown > 0:
             self.attack_cooldown -= dt
 
-# ---------------------------
-# Battle Function (Level 2 Transition)
-# ---------------------------
-def main_level2():
-    """
-    This function represents Level 2: the original level with crow enemies and quotes.
-    For brevity, this is a simplified loop that spawns crow enemies (using EnemyCrow) and displays a quote.
-    """
-    # (Reusing previous EnemyCrow class and a basic level loop)
-    # Load parallax layers for Level 2:
-    parallax_layers = load_parallax_layers()
-    # Set up a new level loop for Level 2
-    score = 0
-    level_start_x = player.world_x
-    fixed_player_screen_x = 100
-    quote_text = "This is a sample quote from Hamlet..."
-    running = True
-    while running:
-        dt = clock.tick(FPS) / 1000.0
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-        player.update(dt)
-        # (For Level 2, spawn crow enemies instead)
-        if random.random() < 0.01:
-            enemy_y = random.randint(SCREEN_HEIGHT - 300, SCREEN_HEIGHT - 80)
-            enemy = EnemyCrow(player.world_x + SCREEN_WIDTH, enemy_y, 2)
-            level_obj.enemy_list.add(enemy)
-        level_obj.enemy_list.update(dt)
-        camera_x = player.world_x - fixed_player_screen_x
-        screen.fill(BLACK)
-        for layer_surface, factor in parallax_layers:
-            layer_offset = -camera_x * factor
-            screen.blit(layer_surface, (layer_offset, 0))
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        for enemy in level_obj.enemy_list:
-            enemy_screen_rect = enemy.rect.copy()
-            enemy_screen_rect.x = enemy.world_x - camera_x
-            screen.blit(enemy.image, enemy_screen_rect)
-        # Display a HUD and quote
-        hud_text = f"Score: {score}   Health: {player.health}"
-        hud_surface = render_gradient_text(hud_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        screen.blit(hud_surface, (20, 20))
-        quote_surface = render_gradient_text(quote_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        quote_rect = quote_surface.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
-        screen.blit(quote_surface, quote_rect)
-        pygame.display.flip()
-        # For demonstration, exit after 30 seconds
-        if time.time() - level_start_time > 30:
-            running = False
-
 # ---------------------------
 # EnemyCrow Class (Level 2)
 # ---------------------------
 class EnemyCrow(pygame.sprite.Sprite):
     """Crow enemy that animates using a sprite sheet from crow_fly.png."""
-    def __init__(self, x, y, speed):
-        pygame.sprite.Sprite.__init__(self)
+    # Scaled frames shared by every instance; loaded on the first spawn.
+    shared_frames = None
+    # Camera position and clock ticks for the current frame, set by the level loop before updating enemies.
+    camera_x = 0
+    ticks = 0
+
+    @classmethod
+    def load_frames(cls):
         crow_sheet_path = os.path.join("assets", "crow_fly.png")
-        if os.path.exists(crow_sheet_path):
-            try:
-                sheet = pygame.image.load(crow_sheet_path).convert_alpha()
-                sheet_rect = sheet.get_rect()
-                frame_width = sheet_rect.width // 2
-                frame_height = sheet_rect.height
-                self.frames = []
-                for i in range(2):
-                    rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
-                    frame = sheet.subsurface(rect).copy()
-                    self.frames.append(frame)
-            except Exception as e:
-                print("Error loading crow_fly.png:", e)
-                fallback = pygame.Surface((48, 48), pygame.SRCALPHA)
-                fallback.fill(RED)
-                self.frames = [fallback]
+        try:
+            sheet = pygame.image.load(crow_sheet_path).convert_alpha()
+        except FileNotFoundError:
+            sheet = None
+        except pygame.error as e:
+            print("Error loading crow_fly.png:", e)
+            sheet = None
+        if sheet is not None:
+            sheet_rect = sheet.get_rect()
+            frame_width = sheet_rect.width // 2
+            frame_height = sheet_rect.height
+            frames = []
+            for i in range(2):
+                rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
+                frames.append(sheet.subsurface(rect))
         else:
-            fallback = pygame.Surface((48, 48), pygame.SRCALPHA)
+            fallback = pygame.Surface((48, 48), pygame.SRCALPHA).convert_alpha()
             fallback.fill(RED)
-            self.frames = [fallback]
-        self.frames = [pygame.transform.scale(frame, (int(frame.get_width()*SPRITE_SCALE),
-                                                        int(frame.get_height()*SPRITE_SCALE)))
-                       for frame in self.frames]
+            frames = [fallback]
+        frames = [pygame.transform.scale(frame, (int(frame.get_width()*SPRITE_SCALE),
+                                                 int(frame.get_height()*SPRITE_SCALE)))
+                  for frame in frames]
+        return tuple(frames)
+
+    def __init__(self, x, y, speed):
+        pygame.sprite.Sprite.__init__(self)
+        if EnemyCrow.shared_frames is None:
+            EnemyCrow.shared_frames = EnemyCrow.load_frames()
+        self.frames = EnemyCrow.shared_frames
         self.current_frame = 0
         self.image = self.frames[self.current_frame]
         self.rect = self.image.get_rect()
+        # rect holds the on-screen position
         self.world_x = x
         self.world_y = y
-        self.rect.x = self.world_x
+        self.rect.x = self.world_x - EnemyCrow.camera_x
         self.rect.y = self.world_y
         self.speed = speed
-        self.animation_timer = 0.0
-        self.animation_delay = 0.15
+        self.animation_start = EnemyCrow.ticks
 
     def update(self, dt):
         self.world_x -= self.speed
-        self.rect.x = self.world_x
-        self.animation_timer += dt
-        if self.animation_timer >= self.animation_delay:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.image = self.frames[self.current_frame]
-            self.animation_timer = 0.0
-        if self.rect.right < 0:
-            self.kill()
+        rect = self.rect
+        rect.x = self.world_x - EnemyCrow.camera_x
+        # Only animate crows near the view; ones past the left edge are removed by despawn_offscreen
+        if rect.x > ANIMATION_RANGE_X or rect.right < 0:
+            return
+        self.current_frame = (EnemyCrow.ticks - self.animation_start) // 150 % len(self.frames)
+        self.image = self.frames[self.current_frame]
 
 # ---------------------------
 # Adaptive Engine Class
@@ -706,14 +724,91 @@ class ActILevel:
         self.bg_start = load_background_act1(start=True)
         self.bg_main = load_background_act1(start=False)
         self.current_bg = self.bg_start
+        self.current_bg_strip = build_tile_strip(self.current_bg)
+
+    def background_blits(self, camera_x):
+        return strip_blits(self.current_bg_strip, self.current_bg, camera_x)
+
+    def background_gap(self, camera_x):
+        """Screen rect the opaque background leaves uncovered past a level edge, or None."""
+        if camera_x < 0:
+            return pygame.Rect(0, 0, -camera_x, SCREEN_HEIGHT)
+        if camera_x > LEVEL_WIDTH - SCREEN_WIDTH:
+            level_end = LEVEL_WIDTH - camera_x
+            return pygame.Rect(level_end, 0, SCREEN_WIDTH - level_end, SCREEN_HEIGHT)
+        return None
 
     def update(self, dt):
         self.enemy_list.update(dt)
+        despawn_offscreen(self.enemy_list)
         if random.random() < 0.01 * self.adaptive_engine.difficulty:
-            enemy_y = random.randint(SCREEN_HEIGHT - 300, SCREEN_HEIGHT - 80)
+            enemy_y = random_spawn_y()
             enemy = GhostEnemy(player.world_x + SCREEN_WIDTH, enemy_y, self.adaptive_engine.enemy_speed)
             self.enemy_list.add(enemy)
 
+# ---------------------------
+# Shared Level Loop
+# ---------------------------
+def run_level(screen, clock, player, score, enemy_cls, enemies, step, background_draws, is_finished, overlays=()):
+    """
+    Frame loop shared by the scrolling levels; returns once is_finished(elapsed) is true.
+    step(dt, elapsed) spawns, updates and despawns the level's enemies, background_draws(camera_x)
+    clears whatever the background leaves uncovered and returns its (surface, dest) pairs, and
+    overlays are drawn over the HUD every frame.
+    """
+    fixed_player_screen_x = 100
+    # Seconds spent in the level, accumulated from the clock's frame times.
+    elapsed = 0.0
+    # HUD surface is only re-rendered when score or health changes.
+    hud_key = None
+    hud_surface = None
+    # Bind per-frame callables and objects to locals once, outside the loop.
+    tick = clock.tick
+    event_get = pygame.event.get
+    get_ticks = pygame.time.get_ticks
+    blits = screen.blits
+    flip = pygame.display.flip
+    update_rects = pygame.display.update
+    # Screen rects drawn last frame; while the camera holds still only these and this frame's need presenting.
+    last_camera_x = None
+    last_frame_rects = []
+
+    while True:
+        dt = tick(FPS) / 1000.0
+        if event_get(pygame.QUIT):
+            pygame.quit(); sys.exit()
+        player.update(dt)
+        elapsed += dt
+        camera_x = player.world_x - fixed_player_screen_x
+        enemy_cls.camera_x = camera_x
+        enemy_cls.ticks = get_ticks()
+        step(dt, elapsed)
+        if is_finished(elapsed):
+            return
+
+        # Background, player and enemies go out in one batched blits call.
+        draws = background_draws(camera_x)
+        # camera_x trails the player by fixed_player_screen_x, so that is the player's screen x.
+        draws.append((player.image, (fixed_player_screen_x, player.rect.y)))
+        # Enemy rects are kept in screen space by their update(); only on-screen ones are drawn.
+        enemy_draws = sprite_blits(enemies)
+        draws.extend(enemy_draws)
+        blits(draws, doreturn=False)
+        if hud_key != (score, player.health):
+            hud_key = (score, player.health)
+            hud_text = f"Score: {score}   Health: {player.health}"
+            hud_surface = render_gradient_text(hud_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
+        frame_rects = blits(((hud_surface, (20, 20)),) + tuple(overlays))
+        frame_rects.append(player.image.get_rect(topleft=(fixed_player_screen_x, player.rect.y)))
+        frame_rects.extend(rect.copy() for _, rect in enemy_draws)
+        if camera_x == last_camera_x:
+            # The background did not scroll, so only the sprites and overlays changed.
+            update_rects(last_frame_rects + frame_rects)
+        else:
+            flip()
+        last_camera_x = camera_x
+        last_frame_rects = frame_rects
+
 # ---------------------------
 # Main Game Loop (Act I)
 # ---------------------------
@@ -721,6 +816,9 @@ def main():
     global quote_index, current_quote, current_quote_kill_count, current_quote_display, quote_reset_time
     global mentor, mentor_spawned, mentor_spoken, chest, chest_spawned, letter_shown, player, score, PIXEL_FONT, level_obj, level_start_time, clock
 
+    # Match the mixer to the 44.1 kHz 16-bit stereo music so playback needs no resampling;
+    # the small buffer keeps the jump sound responsive.
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
     pygame.init()
     pygame.font.init()
     try:
@@ -752,47 +850,40 @@ def main():
     act1_level = ActILevel(adaptive_engine)
     level_obj = act1_level  # For convenience in transition
     player = Player(100, SCREEN_HEIGHT - 100)
-    if os.path.exists("jump.mp3"):
-        player.jump_sound = pygame.mixer.Sound("jump.mp3")
+    # Prefer an uncompressed WAV for the jump sound and fall back to the MP3.
+    for jump_path in ("jump.wav", "jump.mp3"):
+        if os.path.exists(jump_path):
+            player.jump_sound = pygame.mixer.Sound(jump_path)
+            break
     else:
         player.jump_sound = None
 
     score = 0
     level_start_x = player.world_x
-    fixed_player_screen_x = 100
     # Transition: after 5 screen-width scrolls from level_start_x, switch to Level 2
     transition_x = level_start_x + 5 * SCREEN_WIDTH
     level_start_time = time.time()
+    # From here on the levels only react to QUIT (movement reads key.get_pressed()),
+    # so keep every other event type out of the queue.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT])
+
+    def act1_background_draws(camera_x):
+        # The background is opaque and covers the view, so only clear what lies past a level edge.
+        background_gap = act1_level.background_gap(camera_x)
+        if background_gap:
+            screen.fill(BLACK, background_gap)
+        return act1_level.background_blits(camera_x)
 
     # Act I Loop
-    while True:
-        dt = clock.tick(FPS) / 1000.0
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-        player.update(dt)
-        act1_level.update(dt)
-        if player.world_x >= transition_x:
-            # Transition to Level 2:
-            main_level2(screen, player, score, clock)
-            pygame.quit()
-            sys.exit()
-
-        camera_x = player.world_x - fixed_player_screen_x
-
-        screen.fill(BLACK)
-        screen.blit(act1_level.current_bg, (-camera_x, 0))
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        for enemy in act1_level.enemy_list:
-            enemy_screen_rect = enemy.rect.copy()
-            enemy_screen_rect.x = enemy.world_x - camera_x
-            screen.blit(enemy.image, enemy_screen_rect)
-        hud_text = f"Score: {score}   Health: {player.health}"
-        hud_surface = render_gradient_text(hud_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        screen.blit(hud_surface, (20, 20))
-        pygame.display.flip()
+    run_level(screen, clock, player, score, GhostEnemy, act1_level.enemy_list,
+              step=lambda dt, elapsed: act1_level.update(dt),
+              background_draws=act1_background_draws,
+              is_finished=lambda elapsed: player.world_x >= transition_x)
+    # Transition to Level 2:
+    main_level2(screen, player, score, clock)
+    pygame.quit()
+    sys.exit()
 
 # ---------------------------
 # Main Level 2 Loop (Transition Level)
@@ -806,46 +897,36 @@ def main_level2(screen, player, score, clock):
     parallax_layers = load_parallax_layers()
     # Create a simple level object to manage crow enemies.
     level2_enemy_group = pygame.sprite.Group()
-    level2_start_x = player.world_x
-    fixed_player_screen_x = 100
-    start_time = time.time()
     # For quotes, we'll use a simple fixed quote.
     quote_text = "To be, or not to be, that is the question."
-    running = True
-    while running:
-        dt = clock.tick(FPS) / 1000.0
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-        player.update(dt)
+    # The quote never changes, so it is rendered once.
+    quote_surface = render_gradient_text(quote_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
+    quote_rect = quote_surface.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
+    # Crow spawns follow a precomputed schedule instead of a per-frame dice roll;
+    # 0.6 spawns per second matches the old 1% chance per frame at 60 FPS.
+    next_spawn_time = random.expovariate(0.6)
+
+    def level2_step(dt, elapsed):
+        nonlocal next_spawn_time
         # Spawn crow enemies randomly
-        if random.random() < 0.01:
-            enemy_y = random.randint(SCREEN_HEIGHT - 300, SCREEN_HEIGHT - 80)
-            enemy = EnemyCrow(player.world_x + SCREEN_WIDTH, enemy_y, 2)
+        if elapsed >= next_spawn_time:
+            enemy = EnemyCrow(player.world_x + SCREEN_WIDTH, random_spawn_y(), 2)
             level2_enemy_group.add(enemy)
+            next_spawn_time = elapsed + random.expovariate(0.6)
         level2_enemy_group.update(dt)
-        camera_x = player.world_x - fixed_player_screen_x
+        despawn_offscreen(level2_enemy_group)
+
+    def level2_background_draws(camera_x):
+        # The parallax tiles are translucent, so the frame still needs clearing underneath them.
         screen.fill(BLACK)
-        for layer_surface, factor in parallax_layers:
-            layer_offset = -camera_x * factor
-            screen.blit(layer_surface, (layer_offset, 0))
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        for enemy in level2_enemy_group:
-            enemy_screen_rect = enemy.rect.copy()
-            enemy_screen_rect.x = enemy.world_x - camera_x
-            screen.blit(enemy.image, enemy_screen_rect)
-        hud_text = f"Score: {score}   Health: {player.health}"
-        hud_surface = render_gradient_text(hud_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        screen.blit(hud_surface, (20, 20))
-        quote_surface = render_gradient_text(quote_text, PIXEL_FONT, TAN_TOP, TAN_BOTTOM)
-        quote_rect = quote_surface.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
-        screen.blit(quote_surface, quote_rect)
-        pygame.display.flip()
-        # For demonstration, exit after 30 seconds in Level 2
-        if time.time() - start_time > 30:
-            running = False
+        return parallax_blits(parallax_layers, camera_x)
+
+    # For demonstration, exit after 30 seconds in Level 2
+    run_level(screen, clock, player, score, EnemyCrow, level2_enemy_group,
+              step=level2_step,
+              background_draws=level2_background_draws,
+              is_finished=lambda elapsed: elapsed > 30.0,
+              overlays=((quote_surface, quote_rect),))
 
 if __name__ == '__main__':
     main()
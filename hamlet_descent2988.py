@@ -32,6 +32,7 @@ During the Knight battle, combat rules apply (player: 100 HP, Knight: 75 HP, dam
 """
 
 import pygame
+import functools
 import random
 import sys
 import time
@@ -76,6 +77,18 @@ def trim_surface(surface):
         rect = surface.get_rect()
     return surface.subsurface(rect).copy()
 
+@functools.lru_cache(maxsize=32)
+def render_text(font, text, color=WHITE):
+    """Render text once per (font, text, color); repeats reuse the cached surface."""
+    return font.render(text, True, color)
+
+@functools.lru_cache(maxsize=8)
+def quote_backdrop(size):
+    """Translucent black panel drawn behind the quote, cached by size."""
+    backdrop = pygame.Surface(size, pygame.SRCALPHA)
+    backdrop.fill((0, 0, 0, 150))
+    return backdrop
+
 def load_individual_frames(base_folder, animation, frame_count, variant=""):
     """
     Load individual frames for an animation from base_folder.
@@ -147,7 +160,8 @@ def load_level_background(level_index):
     scale_factor = SCREEN_HEIGHT / bg_image.get_height()
     new_width = int(bg_image.get_width() * scale_factor)
     scaled_bg = pygame.transform.scale(bg_image, (new_width, SCREEN_HEIGHT))
-    level_bg = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT))
+    # Opaque and in the display format, so the per-frame blit is a straight copy
+    level_bg = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT)).convert()
     for x in range(0, LEVEL_WIDTH, new_width):
         level_bg.blit(scaled_bg, (x, 0))
     return level_bg
@@ -572,12 +586,8 @@ def battle_with_knight(screen, player, score):
             result_text = "Defeat! You were slain by the Knight."
         camera_x = (player.world_x + knight.world_x) / 2 - SCREEN_WIDTH / 2
         screen.fill(BLACK)
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        knight_screen_rect = knight.rect.copy()
-        knight_screen_rect.x = knight.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        screen.blit(knight.image, knight_screen_rect)
+        screen.blit(player.image, (player.world_x - camera_x, player.rect.y))
+        screen.blit(knight.image, (knight.world_x - camera_x, knight.rect.y))
         p_health_text = font.render(f"Player HP: {player.health}", True, WHITE)
         k_health_text = font.render(f"Knight HP: {knight.health}", True, WHITE)
         score_text = font.render(f"Score: {score}", True, WHITE)
@@ -694,6 +704,7 @@ class Level:
 
     def create_ground(self):
         self.ground_sprite = None
+        self.ground_tile_width = None
         ground_path = "ground.png"
         if os.path.exists(ground_path):
             ground_image = pygame.image.load(ground_path).convert_alpha()
@@ -701,9 +712,13 @@ class Level:
             scale_factor = desired_ground_height / ground_image.get_height()
             new_ground_width = int(ground_image.get_width() * scale_factor)
             scaled_ground = pygame.transform.scale(ground_image, (new_ground_width, desired_ground_height))
-            tiled_ground = pygame.Surface((SCREEN_WIDTH, desired_ground_height), pygame.SRCALPHA)
-            for x in range(0, SCREEN_WIDTH, new_ground_width):
+            # One tile wider than the screen (plus rounding) so a single blit offset by
+            # camera_x modulo the tile width always covers the view.
+            strip_width = (SCREEN_WIDTH // new_ground_width + 2) * new_ground_width
+            tiled_ground = pygame.Surface((strip_width, desired_ground_height), pygame.SRCALPHA).convert_alpha()
+            for x in range(0, strip_width, new_ground_width):
                 tiled_ground.blit(scaled_ground, (x, 0))
+            self.ground_tile_width = new_ground_width
             ground_sprite = pygame.sprite.Sprite()
             ground_sprite.image = tiled_ground
             ground_sprite.rect = tiled_ground.get_rect()
@@ -775,6 +790,9 @@ def main():
 
     score = 0
 
+    font_hud = pygame.font.SysFont("arial", 20)
+    font_quote = pygame.font.SysFont("arial", 30)
+
     while True:
         dt = clock.tick(FPS) / 1000.0
         for event in pygame.event.get():
@@ -875,40 +893,29 @@ def main():
             current_quote_display = current_quote["original"]
             quote_reset_time = None
 
-        # Draw scene
+        # Draw scene: the world layers go out in a single blits call, HUD and quote on top
         screen.fill(BLACK)
-        screen.blit(level_bg, (-camera_x, 0))
+        draw_list = [(level_bg, (-camera_x, 0))]
         if level.ground_sprite:
-            ground_rect = level.ground_sprite.rect.copy()
-            ground_rect.x -= camera_x
-            screen.blit(level.ground_sprite.image, ground_rect)
+            ground_rect = level.ground_sprite.rect
+            ground_x = -(camera_x % level.ground_tile_width)
+            draw_list.append((level.ground_sprite.image, (ground_x, ground_rect.y)))
         if mentor is not None:
-            mentor_rect = mentor.rect.copy()
-            mentor_rect.x = mentor.world_x - camera_x
-            screen.blit(mentor.image, mentor_rect)
+            draw_list.append((mentor.image, (mentor.world_x - camera_x, mentor.rect.y)))
         if chest is not None:
-            chest_rect = chest.rect.copy()
-            chest_rect.x = chest.world_x - camera_x
-            screen.blit(chest.image, chest_rect)
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        for enemy in level.enemy_list:
-            enemy_screen_rect = enemy.rect.copy()
-            enemy_screen_rect.x = enemy.world_x - camera_x
-            screen.blit(enemy.image, enemy_screen_rect)
-        font_hud = pygame.font.SysFont("arial", 20)
+            draw_list.append((chest.image, (chest.world_x - camera_x, chest.rect.y)))
+        draw_list.append((player.image, (player.world_x - camera_x, player.rect.y)))
+        draw_list.extend((enemy.image, (enemy.world_x - camera_x, enemy.rect.y))
+                         for enemy in level.enemy_list)
+        screen.blits(draw_list, doreturn=False)
         hud_text = f"Score: {score}   Health: {player.health}   Time: {int(time.time()-level_start_time)} sec"
-        hud_surface = font_hud.render(hud_text, True, WHITE)
+        hud_surface = render_text(font_hud, hud_text)
         screen.blit(hud_surface, (20, 20))
-        font_quote = pygame.font.SysFont("arial", 30)
-        quote_surface = font_quote.render(current_quote_display, True, WHITE)
+        quote_surface = render_text(font_quote, current_quote_display)
         quote_rect = quote_surface.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
         padding = 20
         bg_rect = quote_rect.inflate(padding, padding)
-        s = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 150))
-        screen.blit(s, bg_rect)
+        screen.blit(quote_backdrop(bg_rect.size), bg_rect)
         screen.blit(quote_surface, quote_rect)
         pygame.display.flip()
 
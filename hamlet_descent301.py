@@ -29,13 +29,18 @@ During the Knight battle, combat rules apply (player: 100 HP, Knight: 75 HP, dam
 """
 
 import pygame
+import functools
+import logging
 import random
 import sys
 import time
 import os
 import textwrap
 
-print("Working Directory:", os.getcwd())
+# Asset-loading and difficulty diagnostics; off by default so spawns never write to stdout
+DEBUG = False
+logging.basicConfig(level=logging.DEBUG if DEBUG else logging.WARNING)
+logging.debug("Working Directory: %s", os.getcwd())
 
 # Constants and Settings
 SPRITE_SCALE = 2.25
@@ -49,6 +54,11 @@ JUMP_STRENGTH = -10
 # Level parameters
 LEVEL_WIDTH = 10 * SCREEN_WIDTH  # Each level spans 10 screen widths
 
+# Cell size of the enemy collision grid, in world pixels
+COLLISION_CELL_SIZE = 128
+# Sprites further than this outside the view are neither updated nor drawn
+VIEW_CULL_MARGIN = 128
+
 # Chest frame dimensions (assumed)
 CHEST_FRAME_WIDTH = 80
 CHEST_FRAME_HEIGHT = 80
@@ -65,42 +75,95 @@ RED = (255, 0, 0)      # fallback for enemies
 # ---------------------------
 def trim_surface(surface):
     """Trim transparent pixels from a surface and return the trimmed surface."""
-    mask = pygame.mask.from_surface(surface)
-    rects = mask.get_bounding_rects()
-    if rects:
-        rect = rects[0]
-    else:
+    # Surface.get_bounding_rect scans the alpha channel directly, without building a Mask
+    # or labelling its connected components.
+    rect = surface.get_bounding_rect()
+    if not rect.width or not rect.height:
         rect = surface.get_rect()
     return surface.subsurface(rect).copy()
 
-def load_individual_frames(base_folder, animation, frame_count, variant=""):
+@functools.lru_cache(maxsize=None)
+def load_image(path, alpha=True):
+    """
+    Load the image at path and convert it to the display format, once per path.
+    Later calls return the same Surface (so callers must not draw onto it);
+    None is returned, and remembered, if the file is missing or unreadable.
+    """
+    try:
+        image = pygame.image.load(path)
+    except (FileNotFoundError, pygame.error):
+        return None
+    return image.convert_alpha() if alpha else image.convert()
+
+def scale_sprite(surface, factor=SPRITE_SCALE):
+    """Scale surface by factor (nearest neighbour) and return it in the display pixel format."""
+    return pygame.transform.scale(surface, (int(surface.get_width()*factor), int(surface.get_height()*factor))).convert_alpha()
+
+def render_digit_glyphs(font, color):
+    """Pre-render the characters of an integer so numbers can be drawn without font.render."""
+    return {char: font.render(char, True, color) for char in "-0123456789"}
+
+def number_blits(label_surface, value, digit_glyphs, x, y, suffix_surface=None):
+    """
+    Return (surface, position) pairs that draw label_surface, the digits of value
+    and an optional suffix_surface left to right starting at (x, y).
+    """
+    draws = [(label_surface, (x, y))]
+    x += label_surface.get_width()
+    for char in str(value):
+        glyph = digit_glyphs[char]
+        draws.append((glyph, (x, y)))
+        x += glyph.get_width()
+    if suffix_surface is not None:
+        draws.append((suffix_surface, (x, y)))
+    return draws
+
+def in_view(world_x, width, camera_x, margin=0):
+    """True if a sprite spanning world_x..world_x + width lies within margin pixels of the view."""
+    return camera_x - margin - width < world_x < camera_x + SCREEN_WIDTH + margin
+
+def list_files(folder):
+    """Return the set of file names in folder (empty if the folder is missing)."""
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+def load_individual_frames(base_folder, animation, frame_count, variant="", available=None):
     """
     Load individual frames for an animation from base_folder.
     Filenames follow the convention:
       adventurer-{animation}{-variant if provided}-{frame_index:02d}.png
+    available is an optional list_files(base_folder) result, used instead of
+    stat-ing every candidate file.
     """
     frames = []
     for i in range(frame_count):
         variant_part = f"-{variant}" if variant else ""
         filename = f"adventurer-{animation}{variant_part}-{i:02d}.png"
         full_path = os.path.join(base_folder, filename)
-        if os.path.exists(full_path):
-            try:
-                image = pygame.image.load(full_path).convert_alpha()
+        if available is not None:
+            present = filename in available
+        else:
+            present = os.path.exists(full_path)
+        if present:
+            image = load_image(full_path)
+            if image is not None:
                 frames.append(image)
-            except Exception as e:
-                print(f"Error loading {full_path}: {e}")
+            else:
+                logging.debug("Error loading %s", full_path)
         else:
-            print(f"Missing file: {full_path}")
+            logging.debug("Missing file: %s", full_path)
     return frames
 
 def show_loadscreen(screen):
     """Display the loadscreen image for 3 seconds or until a key is pressed."""
     loadscreen_path = "loadscreen.png"
-    if os.path.exists(loadscreen_path):
-        load_img = pygame.image.load(loadscreen_path).convert_alpha()
-    else:
-        load_img = pygame.Surface((768, 768), pygame.SRCALPHA)
+    # The loadscreen is drawn over black and covers its whole rect, so keep it opaque.
+    load_img = load_image(loadscreen_path, alpha=False)
+    if load_img is None:
+        load_img = pygame.Surface((768, 768))
         load_img.fill((0, 0, 0))
     scale_factor = min(SCREEN_WIDTH / 768, SCREEN_HEIGHT / 768)
     new_width = int(768 * scale_factor)
@@ -114,20 +177,21 @@ def show_loadscreen(screen):
     start_time = time.time()
     waiting = True
     while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                waiting = False
-            elif event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        # Sleep in SDL until an event arrives or 100 ms pass, rather than spinning on the queue.
+        event = pygame.event.wait(100)
+        if event.type == pygame.KEYDOWN:
+            waiting = False
+        elif event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
         if time.time() - start_time > 10:
             waiting = False
 
 def load_parallax_layers():
     """
     Load two parallax background layers.
-    Each layer is scaled to SCREEN_HEIGHT, tiled horizontally to LEVEL_WIDTH,
-    and paired with a parallax factor.
+    Each layer is a single tile scaled to SCREEN_HEIGHT, returned as a
+    (tile, tile_width, factor) tuple; the main loop repeats it across the view.
     
     Adjust the filenames and factors as desired.
     """
@@ -136,19 +200,15 @@ def load_parallax_layers():
     filenames = ["bg_layer1.png", "bg_layer2.png"]
     factors = [0.3, 0.7]  # Far layer scrolls slower, near layer faster
     for i, file in enumerate(filenames):
-        if os.path.exists(file):
-            img = pygame.image.load(file).convert_alpha()
-        else:
+        img = load_image(file)
+        if img is None:
             # Fallback: a simple colored surface with transparency
             img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
             img.fill((100 + i * 50, 100, 100, 150))
         scale_factor = SCREEN_HEIGHT / img.get_height()
         new_width = int(img.get_width() * scale_factor)
-        scaled_img = pygame.transform.scale(img, (new_width, SCREEN_HEIGHT))
-        layer_surface = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for x in range(0, LEVEL_WIDTH, new_width):
-            layer_surface.blit(scaled_img, (x, 0))
-        layers.append((layer_surface, factors[i]))
+        scaled_img = pygame.transform.scale(img, (new_width, SCREEN_HEIGHT)).convert_alpha()
+        layers.append((scaled_img, new_width, factors[i]))
     return layers
 
 # ---------------------------
@@ -187,19 +247,26 @@ quote_reset_time = None
 # ---------------------------
 class Mentor(pygame.sprite.Sprite):
     """A helper character that does not move. Loads its idle image from mentor_sheet.png."""
-    def __init__(self, x, y):
-        pygame.sprite.Sprite.__init__(self)
+    # Scaled image shared by every instance; built on first construction.
+    shared_image = None
+
+    @classmethod
+    def build_image(cls):
         mentor_image_path = os.path.join("assets", "mentor_sheet.png")
-        if os.path.exists(mentor_image_path):
-            image = pygame.image.load(mentor_image_path).convert_alpha()
+        image = load_image(mentor_image_path)
+        if image is not None:
             # Use a smaller scale for the mentor (75% of SPRITE_SCALE)
             mentor_scale = SPRITE_SCALE * 0.75
-            self.image = pygame.transform.scale(image, 
-                                                  (int(image.get_width() * mentor_scale), 
-                                                   int(image.get_height() * mentor_scale)))
-        else:
-            self.image = pygame.Surface((80, 100), pygame.SRCALPHA)
-            self.image.fill((200, 200, 200))
+            return scale_sprite(image, mentor_scale)
+        fallback = pygame.Surface((80, 100), pygame.SRCALPHA).convert_alpha()
+        fallback.fill((200, 200, 200))
+        return fallback
+
+    def __init__(self, x, y):
+        pygame.sprite.Sprite.__init__(self)
+        if Mentor.shared_image is None:
+            Mentor.shared_image = Mentor.build_image()
+        self.image = Mentor.shared_image
         self.rect = self.image.get_rect()
         self.world_x = x
         # Adjust vertical positioning as needed (here, aligning her bottom with the ground)
@@ -213,6 +280,21 @@ class Mentor(pygame.sprite.Sprite):
 # ---------------------------
 # show_narrative Function
 # ---------------------------
+@functools.lru_cache(maxsize=None)
+def build_narrative_popup(narrative_text):
+    """Render the narrative popup once per text; repeat showings reuse the surface."""
+    popup_width = 800
+    popup_height = 400
+    popup = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
+    popup.fill((0, 0, 0, 200))
+    font = pygame.font.SysFont("arial", 28)
+    # Wrap the text so it fits inside the popup.
+    wrapped_text = textwrap.wrap(narrative_text, width=50)
+    line_height = font.get_height() + 5
+    popup.blits([(font.render(line, True, WHITE), (20, 20 + i * line_height))
+                 for i, line in enumerate(wrapped_text)], doreturn=False)
+    return popup
+
 def show_narrative(screen, mentor):
     """
     Displays a centered popup with Ophelia's narrative.
@@ -221,18 +303,7 @@ def show_narrative(screen, mentor):
     """
     narrative_text = ("Ophelia: You've come to Denmark at a bad time. Our king has died and his brother took the throne. "
                       "The queen has married her brother-in-law. Please solve the riddles and help us discover the truth.")
-    popup_width = 800
-    popup_height = 400
-    popup = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
-    popup.fill((0, 0, 0, 200))
-    font = pygame.font.SysFont("arial", 28)
-    # Wrap the text so it fits inside the popup.
-    wrapped_text = textwrap.wrap(narrative_text, width=50)
-    y_offset = 20
-    for line in wrapped_text:
-        text_surface = font.render(line, True, WHITE)
-        popup.blit(text_surface, (20, y_offset))
-        y_offset += font.get_height() + 5
+    popup = build_narrative_popup(narrative_text)
     popup_rect = popup.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
     screen.blit(popup, popup_rect)
     pygame.display.flip()
@@ -240,14 +311,15 @@ def show_narrative(screen, mentor):
     key_press_count = 0
     waiting = True
     while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                key_press_count += 1
-                if key_press_count >= 3:
-                    waiting = False
-            elif event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        # Sleep in SDL until an event arrives or 100 ms pass, rather than spinning on the queue.
+        event = pygame.event.wait(100)
+        if event.type == pygame.KEYDOWN:
+            key_press_count += 1
+            if key_press_count >= 3:
+                waiting = False
+        elif event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
         if time.time() - start_time >= 10.0:
             waiting = False
 
@@ -256,16 +328,24 @@ def show_narrative(screen, mentor):
 # ---------------------------
 class Chest(pygame.sprite.Sprite):
     """A chest that opens when attacked. Uses frames from chest_sheet.png."""
+    # Scaled frames shared by every instance; built on first construction.
+    shared_frames = None
+
+    @classmethod
+    def build_frames(cls):
+        chest_sheet_path = os.path.join("assets", "chest_sheet.png")
+        frames = load_frames(chest_sheet_path, CHEST_FRAME_WIDTH, CHEST_FRAME_HEIGHT, trim=False)
+        if frames:
+            return [scale_sprite(frame) for frame in frames]
+        fallback = pygame.Surface((80, 80), pygame.SRCALPHA)
+        fallback.fill(RED)
+        return [scale_sprite(fallback)]
+
     def __init__(self, x, y):
         pygame.sprite.Sprite.__init__(self)
-        chest_sheet_path = os.path.join("assets", "chest_sheet.png")
-        if os.path.exists(chest_sheet_path):
-            self.frames = load_frames(chest_sheet_path, CHEST_FRAME_WIDTH, CHEST_FRAME_HEIGHT, trim=False)
-            self.frames = [pygame.transform.scale(frame, (int(frame.get_width()*SPRITE_SCALE), int(frame.get_height()*SPRITE_SCALE)))
-                           for frame in self.frames]
-        else:
-            self.frames = [pygame.Surface((80, 80), pygame.SRCALPHA)]
-            self.frames[0].fill(RED)
+        if Chest.shared_frames is None:
+            Chest.shared_frames = Chest.build_frames()
+        self.frames = Chest.shared_frames
         self.state = "closed"  # states: "closed", "opening", "open"
         self.opened = False
         self.current_frame = 0
@@ -293,16 +373,13 @@ class Chest(pygame.sprite.Sprite):
 # ---------------------------
 # show_letter Function
 # ---------------------------
-def show_letter(screen):
-    """
-    Displays a popup with the letter. The popup shows the letter image (letter.png)
-    and a narrative text.
-    The popup remains for 4 seconds or until a key is pressed.
-    """
+@functools.lru_cache(maxsize=None)
+def build_letter_popup(letter_text):
+    """Render the letter popup once per text; repeat showings reuse the surface."""
     letter_path = os.path.join("assets", "letter.png")
-    if os.path.exists(letter_path):
-        letter_img = pygame.image.load(letter_path).convert_alpha()
-        letter_img = pygame.transform.scale(letter_img, (int(letter_img.get_width()*SPRITE_SCALE), int(letter_img.get_height()*SPRITE_SCALE)))
+    letter_img = load_image(letter_path)
+    if letter_img is not None:
+        letter_img = scale_sprite(letter_img)
     else:
         letter_img = pygame.Surface((100, 100), pygame.SRCALPHA)
         letter_img.fill(WHITE)
@@ -314,28 +391,36 @@ def show_letter(screen):
     letter_rect.centerx = popup_width // 2
     letter_rect.y = 20
     popup.blit(letter_img, letter_rect)
+    font = pygame.font.SysFont("arial", 24)
+    wrapped_text = textwrap.wrap(letter_text, width=70)
+    line_height = font.get_height() + 5
+    popup.blits([(font.render(line, True, WHITE), (20, letter_rect.bottom + 20 + i * line_height))
+                 for i, line in enumerate(wrapped_text)], doreturn=False)
+    return popup
+
+def show_letter(screen):
+    """
+    Displays a popup with the letter. The popup shows the letter image (letter.png)
+    and a narrative text.
+    The popup remains for 4 seconds or until a key is pressed.
+    """
     letter_text = ("You've found a letter, apparently to Hamlet's mother, dated before the King's death. "
                    "'Dearest Gertrude: I promise I will do whatever necessary so we can be together. "
                    "I need only hear your command and I will act. Forever yours, Claudius.'")
-    font = pygame.font.SysFont("arial", 24)
-    wrapped_text = textwrap.wrap(letter_text, width=70)
-    y_offset = letter_rect.bottom + 20
-    for line in wrapped_text:
-        line_surface = font.render(line, True, WHITE)
-        popup.blit(line_surface, (20, y_offset))
-        y_offset += font.get_height() + 5
+    popup = build_letter_popup(letter_text)
     popup_rect = popup.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
     screen.blit(popup, popup_rect)
     pygame.display.flip()
     start_time = time.time()
     waiting = True
     while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                waiting = False
-            elif event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        # Sleep in SDL until an event arrives or 100 ms pass, rather than spinning on the queue.
+        event = pygame.event.wait(100)
+        if event.type == pygame.KEYDOWN:
+            waiting = False
+        elif event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
         if time.time() - start_time >= 4.0:
             waiting = False
 
@@ -353,39 +438,20 @@ class Player(pygame.sprite.Sprite):
         base_path = os.path.join("assets", "adventurer")
         frame_width = 71
         frame_height = 86
-        self.animations['idle'] = load_individual_frames(base_path, "idle", 3)
-        if not self.animations['idle']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['idle'] = [fallback]
-        self.animations['run'] = load_individual_frames(base_path, "run", 3)
-        if not self.animations['run']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['run'] = [fallback]
-        self.animations['jump'] = load_individual_frames(base_path, "jump", 3)
-        if not self.animations['jump']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['jump'] = [fallback]
-        self.animations['attack1'] = load_individual_frames(base_path, "attack1", 3)
-        if not self.animations['attack1']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['attack1'] = [fallback]
-        self.animations['attack2'] = load_individual_frames(base_path, "attack2", 3)
-        if not self.animations['attack2']:
-            fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            fallback.fill(BLUE)
-            pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
-            self.animations['attack2'] = [fallback]
-        for key in self.animations:
-            self.animations[key] = [pygame.transform.scale(frame, (int(frame.get_width()*SPRITE_SCALE), int(frame.get_height()*SPRITE_SCALE)))
-                                    for frame in self.animations[key]]
+        # One directory listing replaces a stat per candidate frame file.
+        available = list_files(base_path)
+        # A single scaled placeholder is shared by every animation that has no frames.
+        fallback = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+        fallback.fill(BLUE)
+        pygame.draw.rect(fallback, WHITE, fallback.get_rect(), 3)
+        fallback = scale_sprite(fallback)
+        for key in ('idle', 'run', 'jump', 'attack1', 'attack2'):
+            frames = load_individual_frames(base_path, key, 3, available=available)
+            self.animations[key] = [scale_sprite(frame) for frame in frames] or [fallback]
+        # Left-facing frames are mirrored once here rather than flipped on every draw.
+        self.animations_flipped = {key: [pygame.transform.flip(frame, True, False) for frame in frames]
+                                   for key, frames in self.animations.items()}
+        self.facing_left = False
         self.state = 'idle'
         self.frames = self.animations[self.state]
         self.current_frame = 0
@@ -404,8 +470,11 @@ class Player(pygame.sprite.Sprite):
         self.jump_count = 0
         self.max_jumps = 3
 
-    def update(self, dt):
-        keys = pygame.key.get_pressed()
+    def facing_animations(self):
+        return self.animations_flipped if self.facing_left else self.animations
+
+    def update(self, dt, keys):
+        """Advance the player by dt seconds; keys is this frame's pygame.key.get_pressed() state."""
         if not self.state.startswith("attack"):
             if keys[pygame.K_LEFT]:
                 self.vel_x = -PLAYER_SPEED
@@ -413,6 +482,10 @@ class Player(pygame.sprite.Sprite):
                 self.vel_x = PLAYER_SPEED
             else:
                 self.vel_x = 0
+            if self.vel_x and (self.vel_x < 0) != self.facing_left:
+                self.facing_left = self.vel_x < 0
+                self.frames = self.facing_animations()[self.state]
+                self.image = self.frames[self.current_frame]
         self.world_x += self.vel_x
         self.vel_y += GRAVITY
         self.world_y += self.vel_y
@@ -445,7 +518,7 @@ class Player(pygame.sprite.Sprite):
                 new_state = 'idle'
         if new_state != self.state:
             self.state = new_state
-            self.frames = self.animations[self.state]
+            self.frames = self.facing_animations()[self.state]
             self.current_frame = 0
             self.animation_timer = 0.0
             self.image = self.frames[self.current_frame]
@@ -457,13 +530,14 @@ class Player(pygame.sprite.Sprite):
                     self.current_frame += 1
                 else:
                     self.state = 'idle'
-                    self.frames = self.animations['idle']
+                    self.frames = self.facing_animations()['idle']
                     self.current_frame = 0
                 self.image = self.frames[self.current_frame]
             else:
                 self.current_frame = (self.current_frame + 1) % len(self.frames)
                 self.image = self.frames[self.current_frame]
-            self.rect = self.image.get_rect()
+            # Resize the existing rect in place rather than allocating a new one per frame advance.
+            self.rect.size = self.image.get_size()
             self.rect.midbottom = old_midbottom
             self.animation_timer = 0.0
         if self.bounce_cooldown > 0:
@@ -481,23 +555,16 @@ class Knight(pygame.sprite.Sprite):
         self.health = 75
         self.animations = {}
         base_path = os.path.join("assets", "knight")
-        try:
-            self.animations['walk'] = [pygame.image.load(os.path.join(base_path, "walk.png")).convert_alpha()]
-        except Exception as e:
-            self.animations['walk'] = []
-        try:
-            self.animations['jump'] = [pygame.image.load(os.path.join(base_path, "Jump.png")).convert_alpha()]
-        except Exception as e:
-            self.animations['jump'] = []
-        try:
-            self.animations['defend'] = [pygame.image.load(os.path.join(base_path, "Defend.png")).convert_alpha()]
-        except Exception as e:
-            self.animations['defend'] = []
-        try:
-            self.animations['attack'] = [pygame.image.load(os.path.join(base_path, "Attack_1.png")).convert_alpha(),
-                                         pygame.image.load(os.path.join(base_path, "Attack_2.png")).convert_alpha()]
-        except Exception as e:
-            self.animations['attack'] = []
+        animation_files = {
+            'walk': ["walk.png"],
+            'jump': ["Jump.png"],
+            'defend': ["Defend.png"],
+            'attack': ["Attack_1.png", "Attack_2.png"],
+        }
+        for key, filenames in animation_files.items():
+            frames = [load_image(os.path.join(base_path, filename)) for filename in filenames]
+            # An animation is only used if every one of its frames loaded.
+            self.animations[key] = frames if None not in frames else []
         if not self.animations['walk']:
             fallback = pygame.Surface((80, 100), pygame.SRCALPHA)
             fallback.fill(RED)
@@ -507,8 +574,7 @@ class Knight(pygame.sprite.Sprite):
             fallback.fill(RED)
             self.animations['attack'] = [fallback]
         for key in self.animations:
-            self.animations[key] = [pygame.transform.scale(frame, (int(frame.get_width()*SPRITE_SCALE), int(frame.get_height()*SPRITE_SCALE)))
-                                    for frame in self.animations[key]]
+            self.animations[key] = [scale_sprite(frame) for frame in self.animations[key]]
         self.state = 'walk'
         self.frames = self.animations[self.state]
         self.current_frame = 0
@@ -551,13 +617,21 @@ def battle_with_knight(screen, player, score):
     battle_running = True
     battle_start_time = time.time()
     font = pygame.font.SysFont("arial", 30)
+    # The HUD labels never change and the numbers are composed from cached digit glyphs,
+    # so nothing is rasterised by SDL_ttf inside the battle loop.
+    digit_glyphs = render_digit_glyphs(font, WHITE)
+    p_health_label = font.render("Player HP: ", True, WHITE)
+    k_health_label = font.render("Knight HP: ", True, WHITE)
+    score_label = font.render("Score: ", True, WHITE)
+    time_label = font.render("Battle Time: ", True, WHITE)
+    time_suffix = font.render(" sec", True, WHITE)
     while battle_running:
         dt = battle_clock.tick(FPS) / 1000.0
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-        player.update(dt)
+        player.update(dt, pygame.key.get_pressed())
         knight.update(dt, player)
         if player.rect.colliderect(knight.rect):
             if player.state.startswith("attack") and player.bounce_cooldown <= 0:
@@ -575,24 +649,22 @@ def battle_with_knight(screen, player, score):
             result_text = "Defeat! You were slain by the Knight."
         camera_x = (player.world_x + knight.world_x) / 2 - SCREEN_WIDTH / 2
         screen.fill(BLACK)
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        knight_screen_rect = knight.rect.copy()
-        knight_screen_rect.x = knight.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        screen.blit(knight.image, knight_screen_rect)
-        p_health_text = font.render(f"Player HP: {player.health}", True, WHITE)
-        k_health_text = font.render(f"Knight HP: {knight.health}", True, WHITE)
-        score_text = font.render(f"Score: {score}", True, WHITE)
         battle_time = int(time.time() - battle_start_time)
-        time_text = font.render(f"Battle Time: {battle_time} sec", True, WHITE)
-        screen.blit(p_health_text, (20, 20))
-        screen.blit(k_health_text, (20, 60))
-        screen.blit(score_text, (20, 100))
-        screen.blit(time_text, (20, 140))
+        # Sprites and HUD go out in one batched blits call.
+        draws = [
+            (player.image, (player.world_x - camera_x, player.rect.y)),
+            (knight.image, (knight.world_x - camera_x, knight.rect.y)),
+        ]
+        draws += number_blits(p_health_label, player.health, digit_glyphs, 20, 20)
+        draws += number_blits(k_health_label, knight.health, digit_glyphs, 20, 60)
+        draws += number_blits(score_label, score, digit_glyphs, 20, 100)
+        draws += number_blits(time_label, battle_time, digit_glyphs, 20, 140, time_suffix)
+        screen.blits(draws, doreturn=False)
         pygame.display.flip()
     end_clock = pygame.time.Clock()
     end_time = time.time()
+    result_surface = font.render(result_text, True, WHITE)
+    result_rect = result_surface.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
     while time.time() - end_time < 3:
         dt = end_clock.tick(FPS) / 1000.0
         for event in pygame.event.get():
@@ -600,8 +672,6 @@ def battle_with_knight(screen, player, score):
                 pygame.quit()
                 sys.exit()
         screen.fill(BLACK)
-        result_surface = font.render(result_text, True, WHITE)
-        result_rect = result_surface.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
         screen.blit(result_surface, result_rect)
         pygame.display.flip()
     return score
@@ -611,18 +681,27 @@ def battle_with_knight(screen, player, score):
 # ---------------------------
 class Enemy(pygame.sprite.Sprite):
     """Crow enemy with animation from crow_fly.png."""
-    def __init__(self, x, y, speed):
-        pygame.sprite.Sprite.__init__(self)
-        self.frames = []
+    # Clock ticks (ms) for the current frame, set once by Level.update before stepping crows.
+    ticks = 0
+    # Scaled frames shared by every crow; built on the first spawn.
+    shared_frames = None
+
+    @classmethod
+    def build_frames(cls):
         crow_sheet_path = "crow_fly.png"
-        if os.path.exists(crow_sheet_path):
-            self.frames = load_frames(crow_sheet_path, 48, 48, trim=False)
-        if not self.frames:
+        frames = load_frames(crow_sheet_path, 48, 48, trim=False)
+        if not frames:
             fallback = pygame.Surface((48, 48), pygame.SRCALPHA)
             fallback.fill(RED)
-            self.frames = [fallback]
-        self.frames = [pygame.transform.scale(frame, (int(frame.get_width()*SPRITE_SCALE), int(frame.get_height()*SPRITE_SCALE)))
-                       for frame in self.frames]
+            frames = [fallback]
+        return [scale_sprite(frame) for frame in frames]
+
+    def __init__(self, x, y, speed):
+        pygame.sprite.Sprite.__init__(self)
+        if Enemy.shared_frames is None:
+            Enemy.shared_frames = Enemy.build_frames()
+        self.frames = Enemy.shared_frames
+        self.frame_count = len(self.frames)
         self.current_frame = 0
         self.image = self.frames[self.current_frame]
         self.rect = self.image.get_rect()
@@ -631,39 +710,41 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.x = self.world_x
         self.rect.y = self.world_y
         self.speed = speed
-        self.animation_timer = 0.0
-        self.animation_delay = 0.15
+        # Animation frames are derived from the shared clock instead of a per-crow timer.
+        self.animation_start = Enemy.ticks
+        self.animation_delay = 150  # ms per frame
 
     def update(self, dt):
         self.world_x -= self.speed
         self.rect.x = self.world_x
-        self.animation_timer += dt
-        if self.animation_timer >= self.animation_delay:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.image = self.frames[self.current_frame]
-            self.animation_timer = 0.0
-        if self.rect.right < 0:
-            self.kill()
+        self.current_frame = (Enemy.ticks - self.animation_start) // self.animation_delay % self.frame_count
+        self.image = self.frames[self.current_frame]
 
 # ---------------------------
 # Helper Function for Enemy Sprite Sheet
 # ---------------------------
 def load_frames(sheet_path, frame_width, frame_height, trim=True):
-    try:
-        sheet = pygame.image.load(sheet_path).convert_alpha()
-    except Exception as e:
-        print("Error loading sheet:", e)
+    sheet = load_image(sheet_path)
+    if sheet is None:
+        logging.warning("Error loading sheet: %s", sheet_path)
         return []
     sheet_rect = sheet.get_rect()
     frames = []
-    for y in range(0, sheet_rect.height - frame_height + 1, frame_height):
-        for x in range(0, sheet_rect.width - frame_width + 1, frame_width):
-            frame = sheet.subsurface(pygame.Rect(x, y, frame_width, frame_height)).copy()
-            if trim:
-                frame = trim_surface(frame)
-            frames.append(frame)
-    for i, frame in enumerate(frames):
-        print(f"Enemy frame {i} size: {frame.get_size()}")
+    # Copying a subsurface locks its parent; hold one lock on the sheet for the whole
+    # pass instead of taking and releasing it once per frame.
+    sheet.lock()
+    try:
+        for y in range(0, sheet_rect.height - frame_height + 1, frame_height):
+            for x in range(0, sheet_rect.width - frame_width + 1, frame_width):
+                frame = sheet.subsurface(pygame.Rect(x, y, frame_width, frame_height)).copy()
+                if trim:
+                    frame = trim_surface(frame)
+                frames.append(frame)
+    finally:
+        sheet.unlock()
+    if DEBUG:
+        for i, frame in enumerate(frames):
+            logging.debug("Enemy frame %d size: %s", i, frame.get_size())
     return frames
 
 # ---------------------------
@@ -683,7 +764,41 @@ class AdaptiveEngine:
         elif performance['deaths'] == 0 and performance['time'] < 60:
             self.difficulty = min(2.0, self.difficulty * 1.1)
             self.enemy_speed = min(5, self.enemy_speed * 1.1)
-        print("Adaptive Engine Update: Difficulty =", self.difficulty, "Enemy Speed =", self.enemy_speed)
+        logging.debug("Adaptive Engine Update: Difficulty = %s Enemy Speed = %s",
+                      self.difficulty, self.enemy_speed)
+
+# ---------------------------
+# Spatial Hash (Broad-phase collision)
+# ---------------------------
+class SpatialHash:
+    """Uniform grid of sprites keyed by the world-space cells their rects overlap."""
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def cell_ranges(self, rect):
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+
+    def rebuild(self, sprites):
+        self.cells.clear()
+        for sprite in sprites:
+            columns, rows = self.cell_ranges(sprite.rect)
+            for cx in columns:
+                for cy in rows:
+                    self.cells.setdefault((cx, cy), []).append(sprite)
+
+    def collide(self, rect):
+        """Return the sprites colliding with rect, testing only those sharing one of its cells."""
+        hits = []
+        columns, rows = self.cell_ranges(rect)
+        for cx in columns:
+            for cy in rows:
+                for sprite in self.cells.get((cx, cy), ()):
+                    if sprite not in hits and rect.colliderect(sprite.rect):
+                        hits.append(sprite)
+        return hits
 
 # ---------------------------
 # Level Class (Handles enemy spawning and visual ground)
@@ -692,21 +807,27 @@ class Level:
     """Handles enemy spawning and draws a visual ground."""
     def __init__(self, adaptive_engine):
         self.enemy_list = pygame.sprite.Group()
+        self.enemy_grid = SpatialHash()
         self.adaptive_engine = adaptive_engine
         self.create_ground()
 
     def create_ground(self):
         self.ground_sprite = None
+        self.ground_tile_width = None
         ground_path = "ground.png"
-        if os.path.exists(ground_path):
-            ground_image = pygame.image.load(ground_path).convert_alpha()
+        ground_image = load_image(ground_path)
+        if ground_image is not None:
             desired_ground_height = SCREEN_HEIGHT // 4
             scale_factor = desired_ground_height / ground_image.get_height()
             new_ground_width = int(ground_image.get_width() * scale_factor)
-            scaled_ground = pygame.transform.scale(ground_image, (new_ground_width, desired_ground_height))
-            tiled_ground = pygame.Surface((SCREEN_WIDTH, desired_ground_height), pygame.SRCALPHA)
-            for x in range(0, SCREEN_WIDTH, new_ground_width):
-                tiled_ground.blit(scaled_ground, (x, 0))
+            scaled_ground = pygame.transform.scale(ground_image, (new_ground_width, desired_ground_height)).convert_alpha()
+            # One tile wider than the screen (rounded up to whole tiles), so a single blit offset by
+            # camera_x modulo the tile width covers the view wherever the camera is.
+            strip_width = (SCREEN_WIDTH // new_ground_width + 2) * new_ground_width
+            tiled_ground = pygame.Surface((strip_width, desired_ground_height), pygame.SRCALPHA).convert_alpha()
+            tiled_ground.blits([(scaled_ground, (x, 0)) for x in range(0, strip_width, new_ground_width)],
+                               doreturn=False)
+            self.ground_tile_width = new_ground_width
             ground_sprite = pygame.sprite.Sprite()
             ground_sprite.image = tiled_ground
             ground_sprite.rect = tiled_ground.get_rect()
@@ -714,12 +835,20 @@ class Level:
             ground_sprite.rect.y = SCREEN_HEIGHT - desired_ground_height
             self.ground_sprite = ground_sprite
 
-    def update(self, dt):
-        self.enemy_list.update(dt)
+    def update(self, dt, camera_x):
+        Enemy.ticks = pygame.time.get_ticks()
+        # Only crows near the view are simulated; ones left behind it are dropped.
+        for enemy in self.enemy_list.sprites():
+            if enemy.world_x + enemy.rect.width < camera_x - VIEW_CULL_MARGIN:
+                enemy.kill()
+            elif in_view(enemy.world_x, enemy.rect.width, camera_x, VIEW_CULL_MARGIN):
+                enemy.update(dt)
         if random.random() < 0.01 * self.adaptive_engine.difficulty:
             enemy_y = random.randint(SCREEN_HEIGHT - 300, SCREEN_HEIGHT - 80)
             enemy = Enemy(player.world_x + SCREEN_WIDTH, enemy_y, self.adaptive_engine.enemy_speed)
             self.enemy_list.add(enemy)
+        # Enemies move every frame, so the collision grid is rebuilt after they have.
+        self.enemy_grid.rebuild(self.enemy_list)
 
 # ---------------------------
 # Global Mentor and Chest Variables
@@ -734,6 +863,14 @@ letter_shown = False
 # ---------------------------
 # Main Game Loop
 # ---------------------------
+@functools.lru_cache(maxsize=8)
+def quote_backdrop(size):
+    """Translucent black panel drawn behind the quote, cached by size."""
+    backdrop = pygame.Surface(size)
+    # Surface alpha on an opaque surface takes SDL's constant-alpha blitter
+    backdrop.set_alpha(150)
+    return backdrop
+
 def main():
     global quote_index, current_quote, current_quote_kill_count, current_quote_display, quote_reset_time
     global mentor, mentor_spawned, mentor_spoken, chest, chest_spawned, letter_shown, player, score
@@ -768,7 +905,7 @@ def main():
     player = Player(100, SCREEN_HEIGHT - 100)
     player.jump_sound = jump_sound
 
-    # Load our two parallax layers (each is a (surface, factor) tuple)
+    # Load our two parallax layers (each is a (tile, tile_width, factor) tuple)
     parallax_layers = load_parallax_layers()
 
     current_level_index = 0
@@ -780,15 +917,19 @@ def main():
 
     score = 0
 
+    font_hud = pygame.font.SysFont("arial", 20)
+    font_quote = pygame.font.SysFont("arial", 30)
+
     while True:
         dt = clock.tick(FPS) / 1000.0
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-        player.update(dt)
-        level.update(dt)
+        keys = pygame.key.get_pressed()
+        player.update(dt, keys)
         camera_x = player.world_x - fixed_player_screen_x
+        level.update(dt, camera_x)
 
         # Mentor encounter: spawn mentor after first screen scroll if not already spawned.
         if not mentor_spawned and player.world_x >= SCREEN_WIDTH:
@@ -818,7 +959,8 @@ def main():
 
         # Update chest animation if chest exists.
         if chest is not None:
-            chest.update(dt)
+            if in_view(chest.world_x, chest.rect.width, camera_x, VIEW_CULL_MARGIN):
+                chest.update(dt)
             # Once chest is open and letter has not been shown, show the letter popup.
             if chest.opened and not letter_shown:
                 show_letter(screen)
@@ -849,7 +991,7 @@ def main():
             level_start_time = time.time()
 
         # Handle crow collisions and update quote mechanism:
-        enemy_hits = pygame.sprite.spritecollide(player, level.enemy_list, False)
+        enemy_hits = level.enemy_grid.collide(player.rect)
         if enemy_hits and player.bounce_cooldown <= 0:
             if player.state.startswith("attack"):
                 for enemy in enemy_hits:
@@ -876,44 +1018,34 @@ def main():
             current_quote_display = current_quote["original"]
             quote_reset_time = None
 
-        # Draw scene
+        # Draw scene: everything is collected as (surface, position) pairs and drawn with one blits call
         screen.fill(BLACK)
-        # Draw each parallax layer using its factor (so layers scroll at different speeds)
-        for layer_surface, factor in parallax_layers:
-            layer_offset = -camera_x * factor
-            screen.blit(layer_surface, (layer_offset, 0))
+        draws = []
+        # Draw each parallax layer using its factor (so layers scroll at different speeds),
+        # wrapping its tile across the view instead of keeping a LEVEL_WIDTH-wide copy
+        for layer_tile, tile_width, factor in parallax_layers:
+            layer_offset = int(camera_x * factor) % tile_width
+            draws.extend((layer_tile, (x, 0)) for x in range(-layer_offset, SCREEN_WIDTH, tile_width))
         if level.ground_sprite:
-            ground_rect = level.ground_sprite.rect.copy()
-            ground_rect.x -= camera_x
-            screen.blit(level.ground_sprite.image, ground_rect)
-        if mentor is not None:
-            mentor_rect = mentor.rect.copy()
-            mentor_rect.x = mentor.world_x - camera_x
-            screen.blit(mentor.image, mentor_rect)
-        if chest is not None:
-            chest_rect = chest.rect.copy()
-            chest_rect.x = chest.world_x - camera_x
-            screen.blit(chest.image, chest_rect)
-        player_screen_rect = player.rect.copy()
-        player_screen_rect.x = player.world_x - camera_x
-        screen.blit(player.image, player_screen_rect)
-        for enemy in level.enemy_list:
-            enemy_screen_rect = enemy.rect.copy()
-            enemy_screen_rect.x = enemy.world_x - camera_x
-            screen.blit(enemy.image, enemy_screen_rect)
-        font_hud = pygame.font.SysFont("arial", 20)
+            draws.append((level.ground_sprite.image,
+                          (-(camera_x % level.ground_tile_width), level.ground_sprite.rect.y)))
+        if mentor is not None and in_view(mentor.world_x, mentor.rect.width, camera_x):
+            draws.append((mentor.image, (mentor.world_x - camera_x, mentor.rect.y)))
+        if chest is not None and in_view(chest.world_x, chest.rect.width, camera_x):
+            draws.append((chest.image, (chest.world_x - camera_x, chest.rect.y)))
+        draws.append((player.image, (player.world_x - camera_x, player.rect.y)))
+        draws.extend((enemy.image, (enemy.world_x - camera_x, enemy.rect.y)) for enemy in level.enemy_list
+                     if in_view(enemy.world_x, enemy.rect.width, camera_x))
         hud_text = f"Score: {score}   Health: {player.health}   Time: {int(time.time()-level_start_time)} sec"
         hud_surface = font_hud.render(hud_text, True, WHITE)
-        screen.blit(hud_surface, (20, 20))
-        font_quote = pygame.font.SysFont("arial", 30)
+        draws.append((hud_surface, (20, 20)))
         quote_surface = font_quote.render(current_quote_display, True, WHITE)
         quote_rect = quote_surface.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
         padding = 20
         bg_rect = quote_rect.inflate(padding, padding)
-        s = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 150))
-        screen.blit(s, bg_rect)
-        screen.blit(quote_surface, quote_rect)
+        draws.append((quote_backdrop(bg_rect.size), bg_rect))
+        draws.append((quote_surface, quote_rect))
+        screen.blits(draws, doreturn=False)
         pygame.display.flip()
 
 if __name__ == '__main__':